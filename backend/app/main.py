@@ -1,22 +1,82 @@
 from __future__ import annotations
 
+import asyncio
+import copy
 import datetime as dt
 import hashlib
 import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
-from fastapi import Depends, FastAPI, Header, HTTPException, Query
+import orjson
+from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
 
 from swsc_core import DataStore, Entry, Race
 
-app = FastAPI(title="SWSC Race Results API", version="2.0.0")
+# Token verification reuses keep-alive connections to Supabase auth. The client
+# is created in lifespan and kept on app.state, so it belongs to the serving loop.
+_AUTH_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Verified tokens are remembered briefly so bursts from one user skip the auth round-trip.
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAXSIZE = 1024
+_TOKEN_CACHE: OrderedDict[bytes, tuple[float, Dict[str, Any]]] = OrderedDict()
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _cached_user(key: bytes) -> Optional[Dict[str, Any]]:
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(key)
+        if cached is None:
+            return None
+        expires_at, payload = cached
+        if expires_at <= time.monotonic():
+            del _TOKEN_CACHE[key]
+            return None
+        _TOKEN_CACHE.move_to_end(key)
+        # Each request gets its own copy, so a handler mutating it cannot leak into others.
+        return copy.deepcopy(payload)
+
+
+def _remember_user(key: bytes, payload: Dict[str, Any]) -> None:
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = (time.monotonic() + _TOKEN_CACHE_TTL, copy.deepcopy(payload))
+        _TOKEN_CACHE.move_to_end(key)
+        while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAXSIZE:
+            _TOKEN_CACHE.popitem(last=False)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    app.state.auth_client = httpx.AsyncClient(timeout=10.0, limits=_AUTH_LIMITS, http2=True)
+    try:
+        yield
+    finally:
+        await app.state.auth_client.aclose()
+        if store.cache_info().currsize:
+            # Release the data store's pooled Supabase client and fetch workers.
+            store().close()
+            store.cache_clear()
+
+
+app = FastAPI(
+    title="SWSC Race Results API",
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -27,24 +87,52 @@ app.add_middleware(
 
 FIN_CODES = ["", "DNF", "DNC", "OCS", "RET", "DSQ"]
 
+# Entry attributes stored alongside each persisted race.
+PERSIST_ENTRY_FIELDS = (
+    "entry_id",
+    "helm",
+    "crew",
+    "dinghy",
+    "py",
+    "personal",
+    "laps",
+    "time_seconds",
+    "fin_code",
+    "sail_number",
+)
+_persist_entry_values = attrgetter(*PERSIST_ENTRY_FIELDS)
+
+_FILENAME_RE = re.compile(r"[^-\w]+")
+_SERIES_PREFIX_RE = re.compile(r"[^A-Z0-9]+")
+
 logger = logging.getLogger(__name__)
 
 
-class RaceMetadata(BaseModel):
+@lru_cache(maxsize=512)
+def _race_filename(series: str, race: str, race_officer: str, date: dt.date) -> str:
+    raw = f"{series}_{race}_{race_officer}_{date.strftime('%d-%m-%Y')}"
+    return _FILENAME_RE.sub("_", raw)
+
+
+class CamelModel(BaseModel):
+    """Base for API models whose JSON fields are the camelCase form of their names."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+
+class RaceMetadata(CamelModel):
     series: str
     race: str
-    race_officer: str = Field(alias="raceOfficer")
+    race_officer: str
     date: dt.date
-    race_number: Optional[int] = Field(default=None, alias="raceNumber")
-    start_time: Optional[dt.time] = Field(default=None, alias="startTime")
-
-    model_config = ConfigDict(populate_by_name=True)
+    race_number: Optional[int] = None
+    start_time: Optional[dt.time] = None
 
     def filename(self) -> str:
-        raw = f"{self.series}_{self.race}_{self.race_officer}_{self.date.strftime('%d-%m-%Y')}"
-        return re.sub(r"[^-\w]+", "_", raw)
+        return _race_filename(self.series, self.race, self.race_officer, self.date)
 
 
+# Explicit aliases: ``code`` arrives as finCode and ``entry_id`` is only accepted by name.
 class EntryPayload(BaseModel):
     entry_id: Optional[str] = Field(default=None, description="Entry ID (auto-generated if not provided)")
     helm: str
@@ -59,276 +147,234 @@ class EntryPayload(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class PyRowModel(BaseModel):
-    entry_id: str = Field(alias="entryId")
+class PyRowModel(CamelModel):
+    entry_id: str
     helm: str
     crew: str
     dinghy: str
     py: int
     laps: int
-    time_seconds: int = Field(alias="timeSeconds")
+    time_seconds: int
     corrected: Optional[int]
     rank: Optional[float]
-    fin_code: str = Field(default="", alias="finCode")
+    fin_code: str = ""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(from_attributes=True)
 
 
-class PersonalRowModel(BaseModel):
-    entry_id: str = Field(alias="entryId")
+class PersonalRowModel(CamelModel):
+    entry_id: str
     helm: str
     crew: str
-    personal_handicap: int = Field(alias="personalHandicap")
+    personal_handicap: int
     corrected: Optional[int]
     rank: Optional[float]
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(from_attributes=True)
 
 
-class ScoreMetadataResponse(BaseModel):
+class ScoreMetadataResponse(CamelModel):
     series: str
     race: str
-    race_number: Optional[int] = Field(default=None, alias="raceNumber")
-    race_officer: str = Field(alias="raceOfficer")
+    race_number: Optional[int] = None
+    race_officer: str
     date: str
-    start_time: Optional[str] = Field(default=None, alias="startTime")
+    start_time: Optional[str] = None
     filename: str
-    generated_at: str = Field(alias="generatedAt")
-
-    model_config = ConfigDict(populate_by_name=True)
+    generated_at: str
 
 
-class ScoreResponse(BaseModel):
+class ScoreResponse(CamelModel):
     metadata: ScoreMetadataResponse
-    py_results: List[PyRowModel] = Field(alias="pyResults")
-    personal_results: List[PersonalRowModel] = Field(alias="personalResults")
+    py_results: List[PyRowModel]
+    personal_results: List[PersonalRowModel]
     summary: str
     html: str
 
-    model_config = ConfigDict(populate_by_name=True)
-
 
-class ScheduledRaceCreate(BaseModel):
+class ScheduledRaceCreate(CamelModel):
     series: str
     race: str
-    race_number: Optional[int] = Field(default=None, alias="raceNumber")
+    race_number: Optional[int] = None
     date: dt.date
-    start_time: Optional[dt.time] = Field(default=None, alias="startTime")
-    race_officer: Optional[str] = Field(default=None, alias="raceOfficer")
+    start_time: Optional[dt.time] = None
+    race_officer: Optional[str] = None
     notes: Optional[str] = None
 
-    model_config = ConfigDict(populate_by_name=True)
-
 
-class ScheduledRaceResponseModel(BaseModel):
+class ScheduledRaceResponseModel(CamelModel):
     id: str
     series: str
     race: str
-    series_code: Optional[str] = Field(default=None, alias="seriesCode")
-    race_number: Optional[int] = Field(default=None, alias="raceNumber")
+    series_code: Optional[str] = None
+    race_number: Optional[int] = None
     date: str
-    start_time: Optional[str] = Field(default=None, alias="startTime")
-    race_officer: Optional[str] = Field(default=None, alias="raceOfficer")
+    start_time: Optional[str] = None
+    race_officer: Optional[str] = None
     notes: Optional[str] = None
 
-    model_config = ConfigDict(populate_by_name=True)
-
 
 class ScheduledRaceListResponse(BaseModel):
     races: List[ScheduledRaceResponseModel]
 
 
-class SeriesCreatePayload(BaseModel):
+class SeriesCreatePayload(CamelModel):
     title: str
     code: Optional[str] = None
-    start_date: Optional[dt.date] = Field(default=None, alias="startDate")
-    end_date: Optional[dt.date] = Field(default=None, alias="endDate")
+    start_date: Optional[dt.date] = None
+    end_date: Optional[dt.date] = None
 
-    model_config = ConfigDict(populate_by_name=True)
 
-
-class SeriesUpdatePayload(BaseModel):
+class SeriesUpdatePayload(CamelModel):
     title: Optional[str] = None
-    start_date: Optional[dt.date] = Field(default=None, alias="startDate")
-    end_date: Optional[dt.date] = Field(default=None, alias="endDate")
-
-    model_config = ConfigDict(populate_by_name=True)
+    start_date: Optional[dt.date] = None
+    end_date: Optional[dt.date] = None
 
 
-class SeriesResponseModel(BaseModel):
+class SeriesResponseModel(CamelModel):
     id: str
     code: str
     title: str
-    start_date: Optional[str] = Field(default=None, alias="startDate")
-    end_date: Optional[str] = Field(default=None, alias="endDate")
-
-    model_config = ConfigDict(populate_by_name=True)
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
 
 
 class SeriesListResponse(BaseModel):
     series: List[SeriesResponseModel]
 
 
-class SeriesScoreCell(BaseModel):
+class SeriesScoreCell(CamelModel):
     value: Optional[float] = None
     counted: bool
-    is_dnc: bool = Field(alias="isDnc")
-
-    model_config = ConfigDict(populate_by_name=True)
+    is_dnc: bool
 
 
-class SeriesScoreSummary(BaseModel):
-    per_race: List[SeriesScoreCell] = Field(alias="perRace")
+class SeriesScoreSummary(CamelModel):
+    per_race: List[SeriesScoreCell]
     total: Optional[float] = None
 
-    model_config = ConfigDict(populate_by_name=True)
-
 
-class SeriesRaceSummary(BaseModel):
+class SeriesRaceSummary(CamelModel):
     id: str
     label: str
-    race_number: Optional[int] = Field(default=None, alias="raceNumber")
+    race_number: Optional[int] = None
     date: Optional[str] = None
-    start_time: Optional[str] = Field(default=None, alias="startTime")
-
-    model_config = ConfigDict(populate_by_name=True)
+    start_time: Optional[str] = None
 
 
-class SeriesStandingsSeriesModel(BaseModel):
+class SeriesStandingsSeriesModel(CamelModel):
     id: str
     code: str
     title: str
-    start_date: Optional[str] = Field(default=None, alias="startDate")
-    end_date: Optional[str] = Field(default=None, alias="endDate")
-    to_count: int = Field(alias="toCount")
-    count_all: bool = Field(alias="countAll")
-    race_count: int = Field(alias="raceCount")
-    competitor_count: int = Field(alias="competitorCount")
-    dnc_value: int = Field(alias="dncValue")
-
-    model_config = ConfigDict(populate_by_name=True)
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    to_count: int
+    count_all: bool
+    race_count: int
+    competitor_count: int
+    dnc_value: int
 
 
-class SeriesCompetitorScores(BaseModel):
+class SeriesCompetitorScores(CamelModel):
     helm: str
     boats: List[str]
     crews: List[str]
     scores: SeriesScoreSummary
     rank: Optional[int] = None
 
-    model_config = ConfigDict(populate_by_name=True)
-
 
-class SeriesStandingsResponse(BaseModel):
+class SeriesStandingsResponse(CamelModel):
     series: SeriesStandingsSeriesModel
     races: List[SeriesRaceSummary]
-    py_results: List[SeriesCompetitorScores] = Field(alias="pyResults")
-    personal_results: List[SeriesCompetitorScores] = Field(alias="personalResults")
+    py_results: List[SeriesCompetitorScores]
+    personal_results: List[SeriesCompetitorScores]
 
-    model_config = ConfigDict(populate_by_name=True)
 
-
-class PortalCrewMemberModel(BaseModel):
-    profile_id: Optional[str] = Field(default=None, alias="profileId")
+class PortalCrewMemberModel(CamelModel):
+    profile_id: Optional[str] = None
     name: str
 
-    model_config = ConfigDict(populate_by_name=True)
 
-
-class SeriesEntryRequestItem(BaseModel):
-    series_id: str = Field(alias="seriesId")
-    helm_profile_id: Optional[str] = Field(default=None, alias="helmProfileId")
-    helm_name: str = Field(alias="helmName")
+class SeriesEntryRequestItem(CamelModel):
+    series_id: str
+    helm_profile_id: Optional[str] = None
+    helm_name: str
     crew: List[PortalCrewMemberModel] = Field(default_factory=list)
-    boat_class: Optional[str] = Field(default=None, alias="boatClass")
-    sail_number: Optional[str] = Field(default=None, alias="sailNumber")
+    boat_class: Optional[str] = None
+    sail_number: Optional[str] = None
     notes: Optional[str] = None
 
-    model_config = ConfigDict(populate_by_name=True)
-
 
 class SeriesEntryCreateRequest(BaseModel):
     entries: List[SeriesEntryRequestItem] = Field(min_length=1)
 
 
-class SeriesSummaryModel(BaseModel):
+class SeriesSummaryModel(CamelModel):
     id: str
     code: Optional[str] = None
     title: Optional[str] = None
-    start_date: Optional[str] = Field(default=None, alias="startDate")
-    end_date: Optional[str] = Field(default=None, alias="endDate")
-
-    model_config = ConfigDict(populate_by_name=True)
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
 
 
-class SeriesEntryRecordModel(BaseModel):
+class SeriesEntryRecordModel(CamelModel):
     id: str
     series: SeriesSummaryModel
-    helm_name: str = Field(alias="helmName")
-    helm_profile_id: Optional[str] = Field(default=None, alias="helmProfileId")
+    helm_name: str
+    helm_profile_id: Optional[str] = None
     crew: List[PortalCrewMemberModel]
-    boat_class: Optional[str] = Field(default=None, alias="boatClass")
-    sail_number: Optional[str] = Field(default=None, alias="sailNumber")
+    boat_class: Optional[str] = None
+    sail_number: Optional[str] = None
     notes: Optional[str] = None
-    submitted_by: Optional[str] = Field(default=None, alias="submittedBy")
-    created_at: str = Field(alias="createdAt")
-
-    model_config = ConfigDict(populate_by_name=True)
+    submitted_by: Optional[str] = None
+    created_at: str
 
 
 class SeriesEntryCreateResponse(BaseModel):
     entries: List[SeriesEntryRecordModel]
 
 
-class RaceSummaryModel(BaseModel):
+class RaceSummaryModel(CamelModel):
     id: str
     label: str
     date: str
-    start_time: Optional[str] = Field(default=None, alias="startTime")
-    race_number: Optional[int] = Field(default=None, alias="raceNumber")
-
-    model_config = ConfigDict(populate_by_name=True)
+    start_time: Optional[str] = None
+    race_number: Optional[int] = None
 
 
-class RaceSignonRecordModel(BaseModel):
+class RaceSignonRecordModel(CamelModel):
     id: str
     series: SeriesSummaryModel
     race: RaceSummaryModel
-    helm_name: str = Field(alias="helmName")
-    helm_profile_id: Optional[str] = Field(default=None, alias="helmProfileId")
+    helm_name: str
+    helm_profile_id: Optional[str] = None
     crew: List[PortalCrewMemberModel]
-    boat_class: Optional[str] = Field(default=None, alias="boatClass")
-    sail_number: Optional[str] = Field(default=None, alias="sailNumber")
+    boat_class: Optional[str] = None
+    sail_number: Optional[str] = None
     notes: Optional[str] = None
-    submitted_by: Optional[str] = Field(default=None, alias="submittedBy")
-    created_at: str = Field(alias="createdAt")
+    submitted_by: Optional[str] = None
+    created_at: str
 
-    model_config = ConfigDict(populate_by_name=True)
 
-
-class RaceSignonRequestModel(BaseModel):
-    series_id: str = Field(alias="seriesId")
-    scheduled_race_ids: List[str] = Field(alias="scheduledRaceIds", min_length=1)
-    helm_profile_id: Optional[str] = Field(default=None, alias="helmProfileId")
-    helm_name: str = Field(alias="helmName")
+class RaceSignonRequestModel(CamelModel):
+    series_id: str
+    scheduled_race_ids: List[str] = Field(min_length=1)
+    helm_profile_id: Optional[str] = None
+    helm_name: str
     crew: List[PortalCrewMemberModel] = Field(default_factory=list)
-    boat_class: Optional[str] = Field(default=None, alias="boatClass")
-    sail_number: Optional[str] = Field(default=None, alias="sailNumber")
+    boat_class: Optional[str] = None
+    sail_number: Optional[str] = None
     notes: Optional[str] = None
-    signon_date: Optional[str] = Field(default=None, alias="signonDate")
-
-    model_config = ConfigDict(populate_by_name=True)
+    signon_date: Optional[str] = None
 
 
 class RaceSignonResponseModel(BaseModel):
     signons: List[RaceSignonRecordModel]
 
 
-class ProfileBoatModel(BaseModel):
-    class_name: str = Field(default="", alias="className")
-    sail_number: Optional[str] = Field(default=None, alias="sailNumber")
-
-    model_config = ConfigDict(populate_by_name=True)
+class ProfileBoatModel(CamelModel):
+    class_name: str = ""
+    sail_number: Optional[str] = None
 
 
 class ProfileRosterModel(BaseModel):
@@ -347,7 +393,7 @@ def store() -> DataStore:
     return DataStore()
 
 
-def require_user(authorization: str = Header(default="")) -> Dict[str, Any]:
+async def require_user(request: Request, authorization: str = Header(default="")) -> Dict[str, Any]:
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Authorization token is required")
 
@@ -355,11 +401,21 @@ def require_user(authorization: str = Header(default="")) -> Dict[str, Any]:
     if not token:
         raise HTTPException(status_code=401, detail="Authorization token is required")
 
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = _cached_user(cache_key)
+    if cached is not None:
+        return cached
+
     supabase_url = os.getenv("SUPABASE_URL", "").rstrip("/")
     supabase_anon_key = os.getenv("SUPABASE_ANON_KEY") or os.getenv("SUPABASE_SERVICE_KEY")
     if not supabase_url or not supabase_anon_key:
         raise HTTPException(status_code=500, detail="Supabase configuration is incomplete")
 
+    # Created by lifespan; an app served without startup has no client to verify with.
+    auth_client: httpx.AsyncClient | None = getattr(request.app.state, "auth_client", None)
+    if auth_client is None:
+        raise HTTPException(status_code=503, detail="Authentication service is not available")
+
     endpoint = f"{supabase_url}/auth/v1/user"
     headers = {
         "Authorization": f"Bearer {token}",
@@ -367,10 +423,9 @@ def require_user(authorization: str = Header(default="")) -> Dict[str, Any]:
     }
 
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(endpoint, headers=headers)
-            response.raise_for_status()
-            payload = response.json()
+        response = await auth_client.get(endpoint, headers=headers)
+        response.raise_for_status()
+        payload = response.json()
     except httpx.HTTPStatusError as exc:
         status = exc.response.status_code if exc.response else 502
         if status in (401, 403):
@@ -384,6 +439,7 @@ def require_user(authorization: str = Header(default="")) -> Dict[str, Any]:
         raise HTTPException(status_code=401, detail="Invalid authentication token")
 
     payload["id"] = user_id
+    _remember_user(cache_key, payload)
     return payload
 
 
@@ -394,12 +450,13 @@ def health() -> dict[str, str]:
 
 @app.get("/reference")
 def reference() -> dict:
-    classes = store().load_handicaps()
+    data_store = store()
+    classes = data_store.load_handicaps()
     return {
         "classes": classes,
         "classOptions": [
             {"key": key, "label": label}
-            for key, label in store().class_display_options()
+            for key, label in data_store.class_display_options()
         ],
         "finCodes": FIN_CODES,
     }
@@ -457,10 +514,10 @@ def series_standings(series_id: str):
 
 
 @app.post("/portal/series-entries", response_model=SeriesEntryCreateResponse)
-def portal_series_entries(payload: SeriesEntryCreateRequest, user: Dict[str, Any] = Depends(require_user)):
+async def portal_series_entries(payload: SeriesEntryCreateRequest, user: Dict[str, Any] = Depends(require_user)):
     try:
         prepared_entries = [item.model_dump(by_alias=True, exclude_unset=True) for item in payload.entries]
-        records = store().create_series_entries(user, prepared_entries)
+        records = await asyncio.to_thread(store().create_series_entries, user, prepared_entries)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:
@@ -469,10 +526,10 @@ def portal_series_entries(payload: SeriesEntryCreateRequest, user: Dict[str, Any
 
 
 @app.post("/portal/signons", response_model=RaceSignonResponseModel)
-def portal_signons(payload: RaceSignonRequestModel, user: Dict[str, Any] = Depends(require_user)):
+async def portal_signons(payload: RaceSignonRequestModel, user: Dict[str, Any] = Depends(require_user)):
     try:
         payload_dict = payload.model_dump(by_alias=True, exclude_unset=True)
-        records = store().create_race_signons(user, payload_dict)
+        records = await asyncio.to_thread(store().create_race_signons, user, payload_dict)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:
@@ -505,27 +562,34 @@ class ScoreRequest(BaseModel):
 
 
 @app.post("/score", response_model=ScoreResponse)
-def score(payload: ScoreRequest):
+def score(payload: ScoreRequest, background_tasks: BackgroundTasks):
+    # Scoring is CPU-bound (validation, Race.score, HTML, encoding), so this stays
+    # a plain def and FastAPI runs it in the threadpool rather than on the loop.
     metadata = payload.metadata
     entries_payload = payload.entries
-    classes = store().load_handicaps()
+    data_store = store()
+    classes = data_store.load_handicaps()
 
     # Entry ID tracking within series
     entry_id_map: Dict[str, str] = {}  # (helm, crew, dinghy) -> entry_id
     next_entry_num = 1
+    series_prefix = _SERIES_PREFIX_RE.sub("", metadata.series.upper())[:4]
 
     race_entries: List[Entry] = []
-    persist_entries: List[dict] = []
 
     for item in entries_payload:
         fin_code = (item.code or "").upper()
         if fin_code and fin_code not in FIN_CODES:
             raise HTTPException(status_code=400, detail=f"Unknown finish code '{fin_code}'")
-        
+
         dinghy = item.dinghy.strip().upper()
-        if dinghy not in classes:
+        py = classes.get(dinghy)
+        if py is None:
             raise HTTPException(status_code=400, detail=f"Unknown dinghy class '{item.dinghy}'")
 
+        helm = item.helm.strip()
+        crew = item.crew.strip()
+
         sail_number = (item.sail_number or "").strip()
 
         # Generate or reuse entry_id
@@ -533,12 +597,11 @@ def score(payload: ScoreRequest):
             entry_id = item.entry_id
         else:
             # Create unique key for this competitor
-            key = f"{item.helm.strip()}|{item.crew.strip()}|{dinghy}"
+            key = f"{helm}|{crew}|{dinghy}"
             if key in entry_id_map:
                 entry_id = entry_id_map[key]
             else:
                 # Generate entry ID from series name and sequence number
-                series_prefix = re.sub(r"[^A-Z0-9]+", "", metadata.series.upper())[:4]
                 entry_id = f"{series_prefix}{next_entry_num:03d}"
                 entry_id_map[key] = entry_id
                 next_entry_num += 1
@@ -546,35 +609,12 @@ def score(payload: ScoreRequest):
         laps = item.laps or 0
         time_seconds = item.time_seconds or 0
 
+        # Positional in Entry field order to skip keyword-argument matching per row.
         race_entries.append(
-            Entry(
-                entry_id=entry_id,
-                helm=item.helm.strip(),
-                crew=item.crew.strip(),
-                dinghy=dinghy,
-                py=classes[dinghy],
-                personal=item.personal,
-                laps=laps,
-                time_seconds=time_seconds,
-                fin_code=fin_code,
-                sail_number=sail_number,
-            )
+            Entry(entry_id, helm, crew, dinghy, py, laps, time_seconds, fin_code, sail_number, item.personal)
         )
 
-        persist_entries.append(
-            {
-                "entry_id": entry_id,
-                "helm": item.helm.strip(),
-                "crew": item.crew.strip(),
-                "dinghy": dinghy,
-                "py": classes[dinghy],
-                "personal": item.personal,
-                "laps": laps,
-                "time_seconds": time_seconds,
-                "fin_code": fin_code,
-                "sail_number": sail_number,
-            }
-        )
+    persist_entries = [dict(zip(PERSIST_ENTRY_FIELDS, _persist_entry_values(entry))) for entry in race_entries]
 
     race = Race(entries=race_entries)
     results = race.score()
@@ -592,41 +632,30 @@ def score(payload: ScoreRequest):
             filename=metadata.filename(),
             generated_at=dt.datetime.utcnow().isoformat() + "Z",
         ),
-        pyResults=[
-            PyRowModel(
-                entryId=row.entry_id,
-                helm=row.helm,
-                crew=row.crew,
-                dinghy=row.dinghy,
-                py=row.py,
-                laps=row.laps,
-                timeSeconds=row.time_seconds,
-                corrected=row.corrected,
-                rank=row.rank,
-                finCode=row.fin_code,
-            )
-            for row in results.py_rows
-        ],
-        personalResults=[
-            PersonalRowModel(
-                entryId=row.entry_id,
-                helm=row.helm,
-                crew=row.crew,
-                personalHandicap=row.personal_handicap,
-                corrected=row.corrected,
-                rank=row.rank,
-            )
-            for row in results.personal_rows
-        ],
+        pyResults=[PyRowModel.model_validate(row) for row in results.py_rows],
+        personalResults=[PersonalRowModel.model_validate(row) for row in results.personal_rows],
         summary=results.summary_text,
         html=results.html,
     )
 
+    # Encode once: the same bytes go over the wire and back into the persisted payload.
+    body = orjson.dumps(response.model_dump(by_alias=True))
+
+    background_tasks.add_task(_persist_score, data_store, payload, body, persist_entries)
+    return Response(content=body, media_type="application/json")
+
+
+def _persist_score(
+    data_store: DataStore,
+    payload: ScoreRequest,
+    body: bytes,
+    persist_entries: List[Dict[str, Any]],
+) -> None:
+    """Best-effort persistence run after the /score response has been sent."""
     try:
-        metadata_json = jsonable_encoder(metadata, by_alias=True)
-        request_payload = jsonable_encoder(payload, by_alias=True)
-        response_payload = jsonable_encoder(response, by_alias=True)
-        store().persist_race(metadata_json, request_payload, response_payload, persist_entries)
+        metadata_json = payload.metadata.model_dump(mode="json", by_alias=True)
+        request_payload = payload.model_dump(mode="json", by_alias=True)
+        response_payload = orjson.loads(body)
+        data_store.persist_race(metadata_json, request_payload, response_payload, persist_entries)
     except Exception:
         logger.exception("Failed to persist race data to Supabase")
-    return response
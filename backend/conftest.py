@@ -0,0 +1,6 @@
+"""Pytest configuration for the backend package."""
+
+# Manual check scripts live beside the app; they run at import time (and may
+# call Supabase), so keep them out of test collection.
+collect_ignore = ["check_api.py", "test_reference.py"]
+collect_ignore_glob = ["tmp_*.py"]
@@ -9,6 +9,8 @@ or CLI `storage/object` upload + `copy` command.
 from __future__ import annotations
 
 import csv
+import io
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Iterator
@@ -52,7 +54,7 @@ FIELDNAMES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HandicapRecord:
     source_list: str
     class_id: str | None
@@ -67,26 +69,23 @@ class HandicapRecord:
     last_published_year: int | None
     years_published: int | None
 
-    def as_dict(self) -> dict[str, str]:
-        def to_str(value: int | str | None) -> str:
-            if value is None:
-                return ""
-            return str(value)
-
-        return {
-            "source_list": self.source_list,
-            "class_id": self.class_id or "",
-            "class_name": self.class_name,
-            "crew_count": to_str(self.crew_count),
-            "rig": self.rig or "",
-            "spinnaker": self.spinnaker or "",
-            "py_number": to_str(self.py_number),
-            "change": to_str(self.change),
-            "notes": self.notes or "",
-            "remark": self.remark or "",
-            "last_published_year": to_str(self.last_published_year),
-            "years_published": to_str(self.years_published),
-        }
+    def as_row(self) -> tuple[str | int | None, ...]:
+        """Return the values in FIELDNAMES order; csv.writer writes None as ""."""
+
+        return (
+            self.source_list,
+            self.class_id,
+            self.class_name,
+            self.crew_count,
+            self.rig,
+            self.spinnaker,
+            self.py_number,
+            self.change,
+            self.notes,
+            self.remark,
+            self.last_published_year,
+            self.years_published,
+        )
 
 
 def _clean(value: str | None) -> str:
@@ -95,8 +94,7 @@ def _clean(value: str | None) -> str:
     return value.strip().strip("\ufeff")
 
 
-def _parse_int(value: str | None) -> int | None:
-    text = _clean(value)
+def _parse_int(text: str) -> int | None:
     if not text:
         return None
     try:
@@ -106,74 +104,63 @@ def _parse_int(value: str | None) -> int | None:
 
 
 def _iter_rows(path: Path) -> Iterator[list[str]]:
-    for encoding in ("utf-8-sig", "cp1252"):
-        try:
-            with path.open(newline="", encoding=encoding) as handle:
-                reader = csv.reader(handle)
-                for row in reader:
-                    yield row
-            return
-        except UnicodeDecodeError:
-            continue
-    raise UnicodeDecodeError("", b"", 0, 0, f"Unable to decode {path}")
+    # Decode the whole file up front so a cp1252 export is neither re-read nor
+    # partially yielded as UTF-8 before the decode error surfaces.
+    data = path.read_bytes()
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = data.decode("cp1252")
+    yield from csv.reader(io.StringIO(text, newline=""))
+
+
+def _clean_rows(path: Path, width: int) -> Iterator[list[str]]:
+    """Yield rows with every cell cleaned once and padded to ``width`` columns."""
+
+    for row in _iter_rows(path):
+        cells = [_clean(cell) for cell in row]
+        if len(cells) < width:
+            cells.extend([""] * (width - len(cells)))
+        yield cells
+
+
+# Prefixes of the title, notice and section rows in the RYA exports. The last two
+# groups are case-insensitive; a leading quote marks a narrative paragraph.
+_HEADER_PREFIX_RE = re.compile(
+    r'(?:Portsmouth|The RYA|"|Users of the PY scheme|For any catamaran classes|RYA Class'
+    r"|(?i:experimental numbers|RYA PN LIST))"
+)
 
 
 def _is_header_row(row: list[str]) -> bool:
-    first = _clean(row[0]) if row else ""
-    if not any(_clean(cell) for cell in row):
-        return True
-    header_tokens = {
-        "RYA Class ID",
-        "RYA PN LIST - Dinghy",
-        "RYA PN List - Multi",
-        "EXPERIMENTAL NUMBERS",
-    }
-    if first in header_tokens:
+    if not any(row):
         return True
-    if first.startswith("Portsmouth") or first.startswith("The RYA"):
+    if _HEADER_PREFIX_RE.match(row[0]):
         return True
-    if first.startswith("\""):
-        # Narrative paragraph wrapped in quotes
-        return True
-    if first.startswith("Users of the PY scheme"):
-        return True
-    if first.startswith("For any catamaran classes"):
-        return True
-    if first.startswith("RYA Class"):
-        return True
-    if first.lower().startswith("experimental numbers"):
-        return True
-    if first.upper().startswith("RYA PN LIST"):
-        return True
-    if len(row) > 1 and _clean(row[1]).lower() == "class name":
-        return True
-    return False
+    return row[1].lower() == "class name"
 
 
 def parse_pn_list() -> Iterable[HandicapRecord]:
-    for row in _iter_rows(PN_LIST_PATH):
-        if not row or _is_header_row(row):
-            continue
-        class_name = _clean(row[1])
-        if class_name.lower() == "class name":
+    for row in _clean_rows(PN_LIST_PATH, 8):
+        if _is_header_row(row):
             continue
+        class_name = row[1]
         if not class_name:
             continue
-        py_number = _parse_int(row[5] if len(row) > 5 else None)
+        py_number = _parse_int(row[5])
         if py_number is None:
             # Skip rows without a published number
             continue
-        notes_value = _clean(row[7]) if len(row) > 7 else ""
         yield HandicapRecord(
             source_list="pn_list",
-            class_id=_clean(row[0]) or None,
+            class_id=row[0] or None,
             class_name=class_name,
-            crew_count=_parse_int(row[2]) if len(row) > 2 else None,
-            rig=_clean(row[3]) or None,
-            spinnaker=_clean(row[4]) or None,
+            crew_count=_parse_int(row[2]),
+            rig=row[3] or None,
+            spinnaker=row[4] or None,
             py_number=py_number,
-            change=_parse_int(row[6]) if len(row) > 6 else None,
-            notes=notes_value or None,
+            change=_parse_int(row[6]),
+            notes=row[7] or None,
             remark=None,
             last_published_year=None,
             years_published=None,
@@ -181,32 +168,29 @@ def parse_pn_list() -> Iterable[HandicapRecord]:
 
 
 def parse_limited_list() -> Iterable[HandicapRecord]:
-    for row in _iter_rows(LIMITED_LIST_PATH):
-        if not row or _is_header_row(row):
-            continue
-        class_name = _clean(row[1])
-        if class_name.lower() == "class name":
+    for row in _clean_rows(LIMITED_LIST_PATH, 9):
+        if _is_header_row(row):
             continue
+        class_name = row[1]
         if not class_name:
             continue
-        py_number = _parse_int(row[6] if len(row) > 6 else None)
+        py_number = _parse_int(row[6])
         if py_number is None:
             # Skip rows without an historical PN
             continue
-        remark_value = _clean(row[5]) if len(row) > 5 else ""
         yield HandicapRecord(
             source_list="limited_list",
-            class_id=_clean(row[0]) or None,
+            class_id=row[0] or None,
             class_name=class_name,
-            crew_count=_parse_int(row[2]) if len(row) > 2 else None,
-            rig=_clean(row[3]) or None,
-            spinnaker=_clean(row[4]) or None,
+            crew_count=_parse_int(row[2]),
+            rig=row[3] or None,
+            spinnaker=row[4] or None,
             py_number=py_number,
             change=None,
             notes=None,
-            remark=remark_value or None,
-            last_published_year=_parse_int(row[7]) if len(row) > 7 else None,
-            years_published=_parse_int(row[8]) if len(row) > 8 else None,
+            remark=row[5] or None,
+            last_published_year=_parse_int(row[7]),
+            years_published=_parse_int(row[8]),
         )
 
 
@@ -217,10 +201,9 @@ def build_csv() -> None:
 
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     with OUTPUT_PATH.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=FIELDNAMES)
-        writer.writeheader()
-        for record in records:
-            writer.writerow(record.as_dict())
+        writer = csv.writer(handle)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(record.as_row() for record in records)
 
     print(f"Wrote {len(records)} rows to {OUTPUT_PATH.relative_to(REPO_ROOT)}")
 
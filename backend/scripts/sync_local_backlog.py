@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import sys
-from typing import Dict, List
+from typing import Dict, Tuple
 
 from swsc_core.loader import DataStore
 
 
-def _format_section(name: str, stats: Dict[str, object]) -> str:
+def _format_section(name: str, stats: Dict[str, object]) -> Tuple[str, bool]:
     synced = stats.get("synced", 0)
     remaining = stats.get("remaining", 0)
     errors = stats.get("errors", [])
@@ -16,7 +16,7 @@ def _format_section(name: str, stats: Dict[str, object]) -> str:
     if isinstance(errors, list):
         for item in errors:
             lines.append(f"  - {item}")
-    return "\n".join(lines)
+    return "\n".join(lines), bool(errors)
 
 
 def main() -> int:
@@ -26,18 +26,14 @@ def main() -> int:
     except RuntimeError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         return 1
+    finally:
+        store.close()
 
-    print(_format_section("Series", summary.get("series", {})))
-    print()
-    print(_format_section("Scheduled races", summary.get("schedule", {})))
+    series_text, series_failed = _format_section("Series", summary.get("series", {}))
+    schedule_text, schedule_failed = _format_section("Scheduled races", summary.get("schedule", {}))
+    sys.stdout.write(f"{series_text}\n\n{schedule_text}\n")
 
-    errors: List[str] = []
-    for stats in summary.values():
-        if isinstance(stats, dict):
-            for item in stats.get("errors", []) or []:
-                errors.append(str(item))
-
-    return 1 if errors else 0
+    return 1 if series_failed or schedule_failed else 0
 
 
 if __name__ == "__main__":
@@ -1,7 +1,35 @@
 """Core racing domain models reused by the API."""
 
-from .entry import Entry
-from .race import Race, ScoreResults
-from .loader import DataStore
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - imports for type checkers only
+    from .entry import Entry
+    from .loader import DataStore
+    from .race import Race, ScoreResults
 
 __all__ = ["Entry", "Race", "ScoreResults", "DataStore"]
+
+# Public names are resolved on first access so that callers which only need
+# the data store (e.g. the sync CLI) do not import the scoring engine.
+_LAZY_ATTRS = {
+    "Entry": ".entry",
+    "Race": ".race",
+    "ScoreResults": ".race",
+    "DataStore": ".loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Entry:
     """An individual race result entry.
 
@@ -34,22 +34,14 @@ class Entry:
         """Recalculate corrected times for PY and personal handicaps."""
 
         self.max_laps = max_laps
-        if self.fin_code:
-            # Retired/DNF style codes are not scored; leave metrics at zero.
-            self.corrected_py = 0
-            self.corrected_personal = 0
+        # Coded finishes (DNF, RET, ...) and incomplete results are not scored.
+        if self.fin_code or not (self.laps and self.time_seconds and self.py):
+            self.corrected_py = self.corrected_personal = 0
             return
 
-        if not self.laps or not self.time_seconds or not self.py:
-            self.corrected_py = 0
-            self.corrected_personal = 0
-            return
-
-        self.corrected_py = int(self.time_seconds * max_laps * 1000 / self.laps / self.py)
-        if self.personal:
-            self.corrected_personal = int(self.corrected_py * 1000 / self.personal)
-        else:
-            self.corrected_personal = 0
+        corrected = int(self.time_seconds * max_laps * 1000 / self.laps / self.py)
+        self.corrected_py = corrected
+        self.corrected_personal = int(corrected * 1000 / self.personal) if self.personal else 0
 
     def audit_delta(self, datum: float) -> int:
         if not datum:
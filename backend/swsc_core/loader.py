@@ -1,23 +1,127 @@
 # Version 2.0.0 - Removed QE codes system, simplified to only load handicaps from Supabase
 from __future__ import annotations
 
+import copy
 import csv
 import datetime as dt
-import json
+import functools
+import heapq
 import logging
 import math
 import os
 import re
+import tempfile
+import threading
+import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import httpx
+import orjson
 
 
 logger = logging.getLogger(__name__)
 
+# Rows sent per PostgREST request when pushing the local backlog.
+SYNC_BATCH_SIZE = 1000
+
+# Connection pool shared by every Supabase request a DataStore makes (HTTP/2 multiplexes
+# concurrent requests over one connection to the project host).
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0)
+
+# Seconds a Supabase read is served from the in-process cache.
+SERIES_CACHE_TTL = 30.0
+SCHEDULE_CACHE_TTL = 15.0
+ROSTER_CACHE_TTL = 60.0
+
+# Worker threads used to overlap independent Supabase round-trips.
+FETCH_WORKERS = 4
+
+# Rank of each handicap source list when a class appears in more than one.
+_SOURCE_LIST_PRIORITY = {"pn_list": 2, "limited_list": 1}
+
+# Columns returned for scheduled race reads and inserts.
+_SCHEDULE_SELECT = "id,series_code,metadata,date,start_time,notes,race_number,race_officer"
+
+_SERIES_CODE_STRIP_RE = re.compile(r"[^A-Z0-9]+")
+# ASCII-only titles (the usual case) are filtered with str.translate instead of the regex.
+_SERIES_CODE_ASCII_DELETE = str.maketrans(
+    "", "", "".join(chr(code) for code in range(128) if not ("A" <= chr(code) <= "Z" or "0" <= chr(code) <= "9"))
+)
+
+# Spellings accepted for the series "countAll" setting.
+_TRUTHY_STRINGS = frozenset({"true", "1", "yes", "y"})
+_FALSY_STRINGS = frozenset({"false", "0", "no", "n"})
+
+# PostgREST / Postgres error wordings that name a column missing from the table.
+_MISSING_COLUMN_PATTERNS = (
+    re.compile(r"could not find the '([^']+)' column", re.IGNORECASE),
+    re.compile(r"column\s+([\w\.]+)\s+does not exist", re.IGNORECASE),
+)
+
+# Page size requested from the Supabase auth admin users listing.
+USERS_PAGE_SIZE = 1000
+
+# Auth user fields checked, in order, when deriving a roster display name.
+_USER_NAME_KEYS = ("display_name", "displayName", "Display Name", "name")
+_USER_METADATA_SOURCES = ("user_metadata", "raw_user_meta_data", "raw_user_metadata", "app_metadata")
+_USER_METADATA_NAME_KEYS = ("full_name", "name", "display_name", "displayName", "Display Name")
+_USER_CONTACT_KEYS = ("email", "phone")
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a Supabase response body with orjson, straight from the raw bytes."""
+    return orjson.loads(response.content)
+
+
+class _Uncached(NamedTuple):
+    """A read result to hand back once without caching it, e.g. a local fallback."""
+
+    value: Any
+
+
+def _invalidates(*names: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Drop the named cached reads once the decorated write returns or raises.
+
+    Invalidating afterwards (rather than before the write) stops a read that
+    runs during the write from caching the old data again.
+    """
+
+    def decorator(method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def wrapper(self: "DataStore", *args: Any, **kwargs: Any) -> Any:
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                for name in names:
+                    self._invalidate(name)
+
+        return wrapper
+
+    return decorator
+
+
+def _date_prefix(value: Any) -> str | None:
+    """Return the ``YYYY-MM-DD`` part of a stored date/timestamp, or ``None`` when absent."""
+    if isinstance(value, dt.date):
+        return value.isoformat()
+    if isinstance(value, str) and value:
+        return value[:10]
+    return None
+
+
+def _new_record_id() -> str:
+    """Return a time-ordered UUIDv7 string so new rows append to the ``id`` index."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
 
 @dataclass
 class DataSources:
@@ -39,6 +143,7 @@ class DataStore:
         self.config_path = config_path or (self.data_dir / "config.json")
         self._sources: DataSources | None = None
         self._handicaps: Dict[str, int] | None = None
+        self._display_labels: Dict[str, str] | None = None
         self._display_options: List[Tuple[str, str]] | None = None
         
         # Supabase configuration
@@ -58,6 +163,40 @@ class DataStore:
         self.supabase_profiles_table = os.getenv("SUPABASE_PROFILES_TABLE", "profiles")
         self.supabase_series_entries_table = os.getenv("SUPABASE_SERIES_ENTRIES_TABLE", "series_entries")
         self.supabase_series_signons_table = os.getenv("SUPABASE_SERIES_SIGNONS_TABLE", "series_signons")
+
+        supabase_base = self.supabase_url.rstrip("/")
+        self._rest_base = f"{supabase_base}/rest/v1/"
+        self._auth_base = f"{supabase_base}/auth/v1/"
+
+        # Which Supabase paths are usable is fixed once configuration is read.
+        self._supabase_enabled = bool(self.supabase_url and self.supabase_key)
+        self._profiles_enabled = self._supabase_enabled and bool(self.supabase_profiles_table)
+        self._series_enabled = self._supabase_enabled and bool(self.supabase_series_table)
+        self._races_enabled = self._supabase_enabled and bool(self.supabase_races_table)
+        self._schedule_enabled = self._supabase_enabled and bool(self.supabase_schedule_table)
+        self._series_entries_enabled = self._supabase_enabled and bool(self.supabase_series_entries_table)
+        self._series_signons_enabled = self._supabase_enabled and bool(self.supabase_series_signons_table)
+
+        # Header sets are fixed once configuration is read; _supabase_headers copies them per request.
+        self._auth_headers = {
+            "apikey": self.supabase_key,
+            "Authorization": f"Bearer {self.supabase_key}",
+            "Accept": "application/json",
+        }
+        custom_schema = self.supabase_schema if self.supabase_schema and self.supabase_schema != "public" else None
+        self._read_headers = dict(self._auth_headers)
+        self._write_headers = dict(self._auth_headers)
+        if custom_schema:
+            self._read_headers["Accept-Profile"] = custom_schema
+            self._write_headers["Content-Profile"] = custom_schema
+            self._write_headers["Accept-Profile"] = custom_schema
+        # Every merge-duplicates upsert sends the same headers; httpx does not mutate them.
+        self._upsert_headers = {
+            **self._write_headers,
+            "Prefer": "resolution=merge-duplicates,return=representation",
+            "Content-Type": "application/json",
+        }
+
         self.local_series_path = self.data_dir / "series_local.json"
         self.local_schedule_path = self.data_dir / "scheduled_races_local.json"
         self.local_series_entries_path = self.data_dir / "series_entries_local.json"
@@ -68,39 +207,117 @@ class DataStore:
         self._entries_supports_entry_id: bool | None = None
         self._entries_excluded_fields: set[str] = set()
         self._entries_conflict_target: str | None = None
+        self._client: httpx.Client | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        # Request threads and fetch workers may both be first to need the client or pool.
+        self._resources_lock = threading.Lock()
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        # Bumped by _invalidate so a read that overlaps a write is not cached.
+        self._cache_generations: Dict[str, int] = {}
+        self._cache_lock = threading.Lock()
+
+    def _http_client(self) -> httpx.Client:
+        """Return the shared pooled client, creating it on first use."""
+        client = self._client
+        if client is None:
+            with self._resources_lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.Client(timeout=10.0, limits=HTTP_LIMITS, http2=True)
+        return client
+
+    def _fetch_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool for concurrent Supabase reads, creating it on first use."""
+        executor = self._executor
+        if executor is None:
+            with self._resources_lock:
+                executor = self._executor
+                if executor is None:
+                    executor = self._executor = ThreadPoolExecutor(
+                        max_workers=FETCH_WORKERS, thread_name_prefix="supabase-fetch"
+                    )
+        return executor
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and worker threads, if they were started."""
+        with self._resources_lock:
+            executor, self._executor = self._executor, None
+        # Drain the workers before taking the client: pending fetches still use it.
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._resources_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def _cached(self, key: Tuple[Any, ...], ttl: float, fetcher: Callable[[], Any]) -> Any:
+        """Return a copy of a cached Supabase read younger than ``ttl`` seconds, else refetch it.
+
+        Callers get their own copy, so mutating a result never alters the cache.
+        A fetcher returns :class:`_Uncached` for results that must not be kept.
+        """
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            generation = self._cache_generations.get(key[0], 0)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < ttl:
+            return copy.deepcopy(hit[1])
+        value = fetcher()
+        if isinstance(value, _Uncached):
+            return value.value
+        with self._cache_lock:
+            if self._cache_generations.get(key[0], 0) == generation:
+                self._cache[key] = (now, value)
+        return copy.deepcopy(value)
+
+    def _invalidate(self, name: str) -> None:
+        """Drop every cached read whose key starts with ``name``."""
+        with self._cache_lock:
+            self._cache_generations[name] = self._cache_generations.get(name, 0) + 1
+            for key in list(self._cache):
+                if key[0] == name:
+                    del self._cache[key]
 
     def load_handicaps(self) -> Dict[str, int]:
         """Load handicap numbers from Supabase or CSV fallback."""
         if self._handicaps is not None:
             return self._handicaps
 
-        if self.supabase_url and self.supabase_key:
+        if self._supabase_enabled:
             handicaps, display = self._handicaps_from_supabase()
         else:
             handicaps, display = self._handicaps_from_file()
 
         self._handicaps = handicaps
-        self._display_options = [(key, label) for key, label in display.items()]
-        self._display_options.sort(key=lambda item: item[1])
+        self._display_labels = display
+        self._display_options = None
 
         return self._handicaps
 
     def class_display_options(self) -> List[Tuple[str, str]]:
         """Get list of (key, label) pairs for class dropdown options."""
         if self._display_options is None:
-            self.load_handicaps()
-        return self._display_options or []
+            if self._display_labels is None:
+                self.load_handicaps()
+            # Sorted on first use only; scoring requests never need the dropdown order.
+            self._display_options = sorted((self._display_labels or {}).items(), key=itemgetter(1))
+        return self._display_options
 
     def fetch_profiles_roster(self) -> List[Dict[str, Any]]:
         """Fetch profile roster (names and boats) from Supabase."""
-        if not (self.supabase_url and self.supabase_key and self.supabase_profiles_table):
+        if not self._profiles_enabled:
             return []
 
-        profile_rows = self._fetch_supabase_profile_rows()
-        if not profile_rows:
-            return []
+        return self._cached(("roster",), ROSTER_CACHE_TTL, self._fetch_profiles_roster_supabase)
 
+    def _fetch_profiles_roster_supabase(self) -> List[Dict[str, Any]]:
+        # The profile and auth user queries are independent, so run them side by side.
+        # The users query stays on this thread because it fans its pages out to the pool.
+        profiles_future = self._fetch_executor().submit(self._fetch_supabase_profile_rows)
         users = self._fetch_supabase_users()
+        profile_rows = profiles_future.result()
+        if not profile_rows:
+            return []
 
         roster: List[Dict[str, Any]] = []
         profiles_seen: set[str] = set()
@@ -111,16 +328,14 @@ class DataStore:
             profiles_seen.add(profile_id)
 
             boats_raw = row.get("boats")
-            boats: List[Dict[str, Any]] = []
-            if isinstance(boats_raw, list):
-                for boat in boats_raw:
-                    if isinstance(boat, dict):
-                        boats.append(
-                            {
-                                "className": str(boat.get("className") or "").strip(),
-                                "sailNumber": str(boat.get("sailNumber") or "").strip(),
-                            }
-                        )
+            boats = [
+                {
+                    "className": str(boat.get("className") or "").strip(),
+                    "sailNumber": str(boat.get("sailNumber") or "").strip(),
+                }
+                for boat in (boats_raw if isinstance(boats_raw, list) else ())
+                if isinstance(boat, dict)
+            ]
 
             user = users.get(profile_id)
             display_name = self._extract_user_display_name(user)
@@ -148,20 +363,11 @@ class DataStore:
                 }
             )
 
-        for user_id, user in users.items():
-            if user_id in profiles_seen:
-                continue
-            display_name = self._extract_user_display_name(user)
-            if not display_name:
-                continue
-            roster.append(
-                {
-                    "id": user_id,
-                    "helm": display_name,
-                    "crew": display_name,
-                    "boats": [],
-                }
-            )
+        roster.extend(
+            {"id": user_id, "helm": display_name, "crew": display_name, "boats": []}
+            for user_id, user in users.items()
+            if user_id not in profiles_seen and (display_name := self._extract_user_display_name(user))
+        )
 
         roster.sort(key=lambda item: (item.get("helm") or item.get("crew") or "").lower())
 
@@ -182,10 +388,10 @@ class DataStore:
                 "order": attempt["order"],
             }
             try:
-                with httpx.Client(timeout=10.0) as client:
-                    response = client.get(endpoint, params=params, headers=headers_primary)
-                    response.raise_for_status()
-                    rows = response.json()
+                client = self._http_client()
+                response = client.get(endpoint, params=params, headers=headers_primary)
+                response.raise_for_status()
+                rows = _decode_json(response)
             except httpx.HTTPStatusError as exc:
                 if exc.response.status_code in (400, 406) and attempt_index < len(attempts) - 1:
                     continue
@@ -203,22 +409,27 @@ class DataStore:
         return []
 
     def _fetch_supabase_users(self) -> Dict[str, Dict[str, Any]]:
-        if not (self.supabase_url and self.supabase_key):
+        if not self._supabase_enabled:
             return {}
 
-        endpoint = f"{self.supabase_url.rstrip('/')}/auth/v1/admin/users"
-        headers = {
-            "apikey": self.supabase_key,
-            "Authorization": f"Bearer {self.supabase_key}",
-            "Accept": "application/json",
-        }
-        params = {"per_page": 1000}
+        endpoint = self._auth_base + "admin/users"
+        headers = self._auth_headers
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(endpoint, params=params, headers=headers)
-                response.raise_for_status()
-                payload = response.json()
+            response, payload = self._fetch_supabase_users_page(endpoint, headers, 1)
+            records = self._user_records_from_payload(payload)
+            if records is None:
+                logger.warning("Supabase users query returned unexpected payload: %s", type(payload))
+                return {}
+            page_count = self._user_page_count(response, payload)
+            if page_count > 1:
+                # Later pages do not depend on each other, so fetch them concurrently.
+                pages = self._fetch_executor().map(
+                    lambda page: self._fetch_supabase_users_page(endpoint, headers, page)[1],
+                    range(2, page_count + 1),
+                )
+                for page_payload in pages:
+                    records.extend(self._user_records_from_payload(page_payload) or [])
         except httpx.HTTPStatusError as exc:
             if exc.response.status_code == 403:
                 logger.info(
@@ -231,15 +442,6 @@ class DataStore:
             logger.warning("Supabase users query failed (%s)", exc)
             return {}
 
-        records: List[Dict[str, Any]]
-        if isinstance(payload, dict) and isinstance(payload.get("users"), list):
-            records = [item for item in payload["users"] if isinstance(item, dict)]
-        elif isinstance(payload, list):
-            records = [item for item in payload if isinstance(item, dict)]
-        else:
-            logger.warning("Supabase users query returned unexpected payload: %s", type(payload))
-            return {}
-
         result: Dict[str, Dict[str, Any]] = {}
         for item in records:
             user_id = str(item.get("id") or "").strip()
@@ -249,73 +451,90 @@ class DataStore:
 
         return result
 
+    def _fetch_supabase_users_page(
+        self,
+        endpoint: str,
+        headers: Dict[str, str],
+        page: int,
+    ) -> Tuple[httpx.Response, Any]:
+        params = {"page": page, "per_page": USERS_PAGE_SIZE}
+        response = self._http_client().get(endpoint, params=params, headers=headers)
+        response.raise_for_status()
+        return response, _decode_json(response)
+
+    @staticmethod
+    def _user_records_from_payload(payload: Any) -> List[Dict[str, Any]] | None:
+        if isinstance(payload, dict) and isinstance(payload.get("users"), list):
+            return [item for item in payload["users"] if isinstance(item, dict)]
+        if isinstance(payload, list):
+            return [item for item in payload if isinstance(item, dict)]
+        return None
+
+    @staticmethod
+    def _user_page_count(response: httpx.Response, payload: Any) -> int:
+        total_raw = response.headers.get("x-total-count")
+        if total_raw is None and isinstance(payload, dict):
+            total_raw = payload.get("total")
+        try:
+            total = int(total_raw)
+        except (TypeError, ValueError):
+            return 1
+        return max(1, math.ceil(total / USERS_PAGE_SIZE))
+
     @staticmethod
     def _extract_user_display_name(user: Dict[str, Any] | None) -> str:
         if not user:
             return ""
 
-        for key in ("display_name", "displayName", "Display Name", "name"):
+        for key in _USER_NAME_KEYS:
             value = user.get(key)
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-
-        metadata_fields = (
-            user.get("user_metadata"),
-            user.get("raw_user_meta_data"),
-            user.get("raw_user_metadata"),
-            user.get("app_metadata"),
-        )
-        for metadata in metadata_fields:
-            if not isinstance(metadata, dict):
+            if isinstance(value, str) and (stripped := value.strip()):
+                return stripped
+
+        for source in _USER_METADATA_SOURCES:
+            metadata = user.get(source)
+            if not metadata or not isinstance(metadata, dict):
                 continue
-            for key in ("full_name", "name", "display_name", "displayName", "Display Name"):
+            for key in _USER_METADATA_NAME_KEYS:
                 value = metadata.get(key)
-                if isinstance(value, str) and value.strip():
-                    return value.strip()
+                if isinstance(value, str) and (stripped := value.strip()):
+                    return stripped
 
-        email = user.get("email")
-        if isinstance(email, str) and email.strip():
-            return email.strip()
-
-        phone = user.get("phone")
-        if isinstance(phone, str) and phone.strip():
-            return phone.strip()
+        for key in _USER_CONTACT_KEYS:
+            value = user.get(key)
+            if isinstance(value, str) and (stripped := value.strip()):
+                return stripped
 
         return ""
 
     def _handicaps_from_supabase(self) -> Tuple[Dict[str, int], Dict[str, str]]:
         """Load handicaps from Supabase REST API."""
-        endpoint = self.supabase_url.rstrip("/") + "/rest/v1/" + self.supabase_table
+        endpoint = self._supabase_endpoint(self.supabase_table)
         params = {
             "select": "class_name,py_number,source_list",
         }
-        headers = {
-            "apikey": self.supabase_key,
-            "Authorization": f"Bearer {self.supabase_key}",
-            "Accept": "application/json",
-        }
-        if self.supabase_schema and self.supabase_schema != "public":
-            headers["Accept-Profile"] = self.supabase_schema
+        headers = self._read_headers
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(endpoint, params=params, headers=headers)
-                response.raise_for_status()
-                rows = response.json()
+            client = self._http_client()
+            response = client.get(endpoint, params=params, headers=headers)
+            response.raise_for_status()
+            rows = _decode_json(response)
         except httpx.HTTPError as exc:
             raise RuntimeError(f"Failed to load handicaps from Supabase: {exc}") from exc
 
         if not isinstance(rows, list):
             raise RuntimeError("Unexpected payload from Supabase handicaps endpoint")
 
-        priority = {"pn_list": 2, "limited_list": 1}
-        handicaps_with_priority: Dict[str, Tuple[int, int]] = {}
+        best_priority: Dict[str, int] = {}
+        final_handicaps: Dict[str, int] = {}
         display: Dict[str, str] = {}
 
         for row in rows:
             if not isinstance(row, dict):
                 continue
-            class_name = str(row.get("class_name") or "").strip()
+            raw_name = row.get("class_name")
+            class_name = raw_name.strip() if isinstance(raw_name, str) else ""
             if not class_name:
                 continue
             py_number = row.get("py_number")
@@ -323,17 +542,14 @@ class DataStore:
                 py_value = int(py_number)
             except (TypeError, ValueError):
                 continue
-            source_list = row.get("source_list") or ""
-            priority_score = priority.get(str(source_list), 0)
+            priority_score = _SOURCE_LIST_PRIORITY.get(row.get("source_list"), 0)
 
             canonical_key = class_name.upper()
-            existing = handicaps_with_priority.get(canonical_key)
-            if not existing or priority_score > existing[1]:
-                handicaps_with_priority[canonical_key] = (py_value, priority_score)
+            if priority_score > best_priority.get(canonical_key, -1):
+                best_priority[canonical_key] = priority_score
+                final_handicaps[canonical_key] = py_value
                 display[canonical_key] = class_name
 
-        final_handicaps = {cls: value for cls, (value, _) in handicaps_with_priority.items()}
-
         if not final_handicaps:
             raise RuntimeError("Supabase query returned zero handicap rows")
 
@@ -344,7 +560,7 @@ class DataStore:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
         
-        raw = json.loads(self.config_path.read_text())
+        raw = orjson.loads(self.config_path.read_bytes())
         if not isinstance(raw, list) or len(raw) < 1:
             raise ValueError("config.json must contain at least handicaps file path")
         
@@ -358,14 +574,16 @@ class DataStore:
         with handicap_file.open(newline="") as fh:
             reader = csv.reader(fh)
             for row in reader:
-                if not row or not row[0].strip():
+                if len(row) < 2:
                     continue
                 raw_name = row[0].strip()
-                dinghy = raw_name.upper()
+                if not raw_name:
+                    continue
                 try:
                     py_value = int(row[1])
-                except (IndexError, ValueError):
+                except ValueError:
                     continue
+                dinghy = raw_name.upper()
                 handicaps[dinghy] = py_value
                 display[dinghy] = raw_name
         
@@ -377,6 +595,7 @@ class DataStore:
     # ------------------------------------------------------------------
     # Race persistence helpers
 
+    @_invalidates("series")
     def persist_race(
         self,
         metadata: Dict[str, Any],
@@ -389,7 +608,7 @@ class DataStore:
         Best-effort operation; failures are logged but do not raise.
         """
 
-        if not (self.supabase_url and self.supabase_key):
+        if not self._supabase_enabled:
             return
 
         series_code = (metadata.get("series") or "").strip()
@@ -418,19 +637,19 @@ class DataStore:
         }
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                series_id = self._persist_get_or_create_series(client, series_code, metadata)
-                if not series_id:
-                    return
-                race_id = self._persist_upsert_race(
-                    client,
-                    series_id,
-                    race_number,
-                    start_time_value,
-                    payload_wrapper,
-                )
-                if race_id and entries:
-                    self._persist_upsert_entries(client, race_id, entries, response_payload)
+            client = self._http_client()
+            series_id = self._persist_get_or_create_series(client, series_code, metadata)
+            if not series_id:
+                return
+            race_id = self._persist_upsert_race(
+                client,
+                series_id,
+                race_number,
+                start_time_value,
+                payload_wrapper,
+            )
+            if race_id and entries:
+                self._persist_upsert_entries(client, race_id, entries, response_payload)
         except Exception:  # pragma: no cover - logging side effect
             logger.exception("Failed to persist race data to Supabase")
 
@@ -438,9 +657,12 @@ class DataStore:
     # Series helpers
 
     def fetch_series(self) -> List[Dict[str, Any]]:
-        if not (self.supabase_url and self.supabase_key and self.supabase_series_table):
+        if not self._series_enabled:
             return self._load_local_series()
 
+        return self._cached(("series",), SERIES_CACHE_TTL, self._fetch_series_supabase)
+
+    def _fetch_series_supabase(self) -> List[Dict[str, Any]] | _Uncached:
         endpoint = self._supabase_endpoint(self.supabase_series_table)
         headers = self._supabase_headers(include_content_profile=False)
         params = {
@@ -449,27 +671,28 @@ class DataStore:
         }
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(endpoint, params=params, headers=headers)
-                response.raise_for_status()
-                rows = response.json()
+            client = self._http_client()
+            response = client.get(endpoint, params=params, headers=headers)
+            response.raise_for_status()
+            rows = _decode_json(response)
         except httpx.HTTPStatusError as exc:
-            if self._handle_series_metadata_error(exc.response):
-                return self.fetch_series()
+            if self._handle_series_metadata_error(self._extract_supabase_detail(exc.response)):
+                return self._fetch_series_supabase()
             raise RuntimeError(f"Failed to fetch series: {exc}") from exc
         except httpx.HTTPError as exc:
             logger.warning("Supabase fetch_series failed (%s); using local fallback", exc)
-            return self._load_local_series()
+            return _Uncached(self._load_local_series())
 
         if not isinstance(rows, list):
             return []
 
         return [self._normalise_series_row(row) for row in rows if isinstance(row, dict)]
 
+    @_invalidates("series")
     def create_series(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         record = self._series_record_for_create(payload)
 
-        if not (self.supabase_url and self.supabase_key and self.supabase_series_table):
+        if not self._series_enabled:
             return self._create_series_local(record)
 
         endpoint = self._supabase_endpoint(self.supabase_series_table)
@@ -480,16 +703,16 @@ class DataStore:
             payload_for_supabase = self._prepare_series_payload(record)
 
             try:
-                with httpx.Client(timeout=10.0) as client:
-                    response = client.post(endpoint, params=params, json=payload_for_supabase, headers=headers)
-                    response.raise_for_status()
-                    rows = response.json()
+                client = self._http_client()
+                response = client.post(endpoint, params=params, content=orjson.dumps(payload_for_supabase), headers=headers)
+                response.raise_for_status()
+                rows = _decode_json(response)
             except httpx.HTTPStatusError as exc:
-                if self._handle_series_metadata_error(exc.response):
+                detail = self._extract_supabase_detail(exc.response)
+                if self._handle_series_metadata_error(detail):
                     continue
 
                 status_code = exc.response.status_code if exc.response else None
-                detail = self._extract_supabase_detail(exc.response)
                 if status_code == 409:
                     existing = self._fetch_existing_series_by_code(record["code"])
                     if existing:
@@ -514,8 +737,9 @@ class DataStore:
             return self._normalise_series_row(rows)
         raise RuntimeError("Unexpected response when creating series")
 
+    @_invalidates("series")
     def update_series(self, series_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        if not (self.supabase_url and self.supabase_key and self.supabase_series_table):
+        if not self._series_enabled:
             return self._update_series_local(series_id, payload)
 
         endpoint = self._supabase_endpoint(self.supabase_series_table)
@@ -527,12 +751,12 @@ class DataStore:
         }
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(endpoint, params=params, headers=headers)
-                response.raise_for_status()
-                rows = response.json()
+            client = self._http_client()
+            response = client.get(endpoint, params=params, headers=headers)
+            response.raise_for_status()
+            rows = _decode_json(response)
         except httpx.HTTPStatusError as exc:
-            if self._handle_series_metadata_error(exc.response):
+            if self._handle_series_metadata_error(self._extract_supabase_detail(exc.response)):
                 return self.update_series(series_id, payload)
             logger.warning("Supabase update_series fetch failed (%s); using local fallback", exc)
             return self._update_series_local(series_id, payload)
@@ -557,21 +781,21 @@ class DataStore:
             payload_for_supabase = self._prepare_series_payload(record)
 
             try:
-                with httpx.Client(timeout=10.0) as client:
-                    response = client.patch(
-                        endpoint,
-                        params=patch_params,
-                        json=payload_for_supabase,
-                        headers=headers,
-                    )
-                    response.raise_for_status()
-                    rows = response.json()
+                client = self._http_client()
+                response = client.patch(
+                    endpoint,
+                    params=patch_params,
+                    content=orjson.dumps(payload_for_supabase),
+                    headers=headers,
+                )
+                response.raise_for_status()
+                rows = _decode_json(response)
             except httpx.HTTPStatusError as exc:
-                if self._handle_series_metadata_error(exc.response):
+                detail = self._extract_supabase_detail(exc.response)
+                if self._handle_series_metadata_error(detail):
                     continue
 
                 status_code = exc.response.status_code if exc.response else None
-                detail = self._extract_supabase_detail(exc.response)
                 if status_code == 409:
                     message = "Series code already exists"
                     if detail and detail.lower() not in message.lower():
@@ -595,7 +819,7 @@ class DataStore:
         return existing
 
     def _fetch_existing_series_by_code(self, code: str) -> Optional[Dict[str, Any]]:
-        if not (self.supabase_url and self.supabase_key and self.supabase_series_table):
+        if not self._series_enabled:
             return None
 
         endpoint = self._supabase_endpoint(self.supabase_series_table)
@@ -607,13 +831,13 @@ class DataStore:
         }
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                get_method = getattr(client, "get", None)
-                if not callable(get_method):
-                    return None
-                response = get_method(endpoint, params=params, headers=headers)
-                response.raise_for_status()
-                rows = response.json()
+            client = self._http_client()
+            get_method = getattr(client, "get", None)
+            if not callable(get_method):
+                return None
+            response = get_method(endpoint, params=params, headers=headers)
+            response.raise_for_status()
+            rows = _decode_json(response)
         except (httpx.HTTPError, AttributeError):
             return None
 
@@ -627,13 +851,20 @@ class DataStore:
     # Scheduled race helpers
 
     def fetch_scheduled_races(self, include_past: bool = False) -> List[Dict[str, Any]]:
-        if not (self.supabase_url and self.supabase_key and self.supabase_schedule_table):
+        if not self._schedule_enabled:
             return self._load_local_schedule(include_past)
 
+        return self._cached(
+            ("schedule", include_past),
+            SCHEDULE_CACHE_TTL,
+            lambda: self._fetch_scheduled_races_supabase(include_past),
+        )
+
+    def _fetch_scheduled_races_supabase(self, include_past: bool) -> List[Dict[str, Any]] | _Uncached:
         endpoint = self._supabase_endpoint(self.supabase_schedule_table)
         headers = self._supabase_headers(include_content_profile=False)
         params = {
-            "select": "id,series_code,metadata,date,start_time,notes,race_number,race_officer",
+            "select": _SCHEDULE_SELECT,
             "order": "date.asc,start_time.asc",
         }
         if not include_past:
@@ -641,10 +872,10 @@ class DataStore:
             params["date"] = f"gte.{today}"
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(endpoint, params=params, headers=headers)
-                response.raise_for_status()
-                rows = response.json()
+            client = self._http_client()
+            response = client.get(endpoint, params=params, headers=headers)
+            response.raise_for_status()
+            rows = _decode_json(response)
         except httpx.HTTPStatusError as exc:
             if exc.response.status_code == 404:
                 if not self._schedule_warning_logged:
@@ -654,34 +885,35 @@ class DataStore:
                         self.supabase_schedule_table,
                     )
                     self._schedule_warning_logged = True
-                return self._load_local_schedule(include_past)
+                return _Uncached(self._load_local_schedule(include_past))
             logger.warning("Supabase fetch_scheduled_races failed (%s); using local fallback", exc)
-            return self._load_local_schedule(include_past)
+            return _Uncached(self._load_local_schedule(include_past))
         except httpx.HTTPError as exc:
             logger.warning("Supabase fetch_scheduled_races failed (%s); using local fallback", exc)
-            return self._load_local_schedule(include_past)
+            return _Uncached(self._load_local_schedule(include_past))
 
         if not isinstance(rows, list):
             return []
 
         return [self._normalise_schedule_row(row) for row in rows if isinstance(row, dict)]
 
+    @_invalidates("schedule")
     def create_scheduled_race(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         record = self._schedule_record_from_payload(payload)
 
-        if not (self.supabase_url and self.supabase_key and self.supabase_schedule_table):
+        if not self._schedule_enabled:
             return self._create_scheduled_race_local(record)
 
         endpoint = self._supabase_endpoint(self.supabase_schedule_table)
         headers = self._supabase_headers("return=representation")
         headers["Content-Type"] = "application/json"
-        params = {"select": "id,series_code,metadata,date,start_time,notes,race_number,race_officer"}
+        params = {"select": _SCHEDULE_SELECT}
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(endpoint, params=params, json=record, headers=headers)
-                response.raise_for_status()
-                rows = response.json()
+            client = self._http_client()
+            response = client.post(endpoint, params=params, content=orjson.dumps(record), headers=headers)
+            response.raise_for_status()
+            rows = _decode_json(response)
         except httpx.HTTPError as exc:
             logger.warning("Supabase create_scheduled_race failed (%s); using local fallback", exc)
             return self._create_scheduled_race_local(record)
@@ -695,18 +927,10 @@ class DataStore:
     # ---- internal Supabase helpers -------------------------------------------------
 
     def _supabase_endpoint(self, table: str) -> str:
-        return f"{self.supabase_url.rstrip('/')}/rest/v1/{table}"
+        return self._rest_base + table
 
     def _supabase_headers(self, prefer: str | None = None, include_content_profile: bool = True) -> Dict[str, str]:
-        headers = {
-            "apikey": self.supabase_key,
-            "Authorization": f"Bearer {self.supabase_key}",
-            "Accept": "application/json",
-        }
-        if include_content_profile and self.supabase_schema and self.supabase_schema != "public":
-            headers["Content-Profile"] = self.supabase_schema
-        if self.supabase_schema and self.supabase_schema != "public":
-            headers["Accept-Profile"] = self.supabase_schema
+        headers = dict(self._write_headers if include_content_profile else self._read_headers)
         if prefer:
             headers["Prefer"] = prefer
         return headers
@@ -724,7 +948,7 @@ class DataStore:
         params = {"select": "id", "code": f"eq.{series_code}", "limit": 1}
         response = client.get(endpoint, params=params, headers=headers)
         response.raise_for_status()
-        rows = response.json()
+        rows = _decode_json(response)
         if isinstance(rows, list) and rows:
             return rows[0].get("id")
 
@@ -733,12 +957,11 @@ class DataStore:
             "title": metadata.get("series"),
             "start_date": metadata.get("date"),
         }
-        headers = self._supabase_headers("resolution=merge-duplicates,return=representation")
-        headers["Content-Type"] = "application/json"
+        headers = self._upsert_headers
         params = {"on_conflict": "code", "select": "id"}
-        response = client.post(endpoint, params=params, json=payload, headers=headers)
+        response = client.post(endpoint, params=params, content=orjson.dumps(payload), headers=headers)
         response.raise_for_status()
-        rows = response.json()
+        rows = _decode_json(response)
         if isinstance(rows, list) and rows:
             return rows[0].get("id")
         return None
@@ -772,11 +995,10 @@ class DataStore:
                 record["race_number"] = race_number
                 params["on_conflict"] = "series_id,race_number"
 
-            headers = self._supabase_headers("resolution=merge-duplicates,return=representation")
-            headers["Content-Type"] = "application/json"
-
             try:
-                response = client.post(endpoint, params=params, json=record, headers=headers)
+                response = client.post(
+                    endpoint, params=params, content=orjson.dumps(record), headers=self._upsert_headers
+                )
                 response.raise_for_status()
             except httpx.HTTPStatusError as exc:
                 detail = self._extract_supabase_detail(exc.response)
@@ -793,7 +1015,7 @@ class DataStore:
                     continue
                 raise
 
-            rows = response.json()
+            rows = _decode_json(response)
             if isinstance(rows, list) and rows:
                 return rows[0].get("id")
             if isinstance(rows, dict):
@@ -818,8 +1040,7 @@ class DataStore:
         if self._entries_supports_entry_id is None:
             self._entries_supports_entry_id = True
 
-        headers = self._supabase_headers("resolution=merge-duplicates,return=representation")
-        headers["Content-Type"] = "application/json"
+        headers = self._upsert_headers
 
         raw_entries = entries
         conflict_target = self._entries_conflict_target
@@ -834,19 +1055,15 @@ class DataStore:
                     continue
                 py_row = py_results.get(entry_id) or {}
                 personal_row = personal_results.get(entry_id) or {}
-                competitor_key = "|".join(
-                    [
-                        (entry.get("helm") or "").strip(),
-                        (entry.get("crew") or "").strip(),
-                        (entry.get("dinghy") or "").strip(),
-                    ]
-                )
+                helm = entry.get("helm")
+                crew = entry.get("crew")
+                dinghy = entry.get("dinghy")
                 record = {
                     "race_id": race_id,
-                    "competitor_key": competitor_key,
-                    "helm": entry.get("helm"),
-                    "crew": entry.get("crew"),
-                    "class_name": entry.get("dinghy"),
+                    "competitor_key": f"{(helm or '').strip()}|{(crew or '').strip()}|{(dinghy or '').strip()}",
+                    "helm": helm,
+                    "crew": crew,
+                    "class_name": dinghy,
                     "py": entry.get("py"),
                     "personal": entry.get("personal"),
                     "sail_number": entry.get("sail_number") or None,
@@ -876,7 +1093,7 @@ class DataStore:
                 params["on_conflict"] = current_conflict
 
             try:
-                response = client.post(endpoint, params=params, json=records, headers=headers)
+                response = client.post(endpoint, params=params, content=orjson.dumps(records), headers=headers)
                 response.raise_for_status()
             except httpx.HTTPStatusError as exc:
                 detail = self._extract_supabase_detail(exc.response)
@@ -908,7 +1125,7 @@ class DataStore:
                 break
 
     def _fetch_series_record(self, series_id: str) -> Dict[str, Any] | None:
-        if not (self.supabase_url and self.supabase_key and self.supabase_series_table):
+        if not self._series_enabled:
             return None
 
         endpoint = self._supabase_endpoint(self.supabase_series_table)
@@ -919,10 +1136,10 @@ class DataStore:
             "limit": 1,
         }
 
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(endpoint, params=params, headers=headers)
-            response.raise_for_status()
-            rows = response.json()
+        client = self._http_client()
+        response = client.get(endpoint, params=params, headers=headers)
+        response.raise_for_status()
+        rows = _decode_json(response)
 
         if isinstance(rows, list) and rows:
             row = rows[0]
@@ -932,21 +1149,23 @@ class DataStore:
         return None
 
     def _fetch_series_races(self, series_id: str) -> List[Dict[str, Any]]:
-        if not (self.supabase_url and self.supabase_key and self.supabase_races_table):
+        if not self._races_enabled:
             return []
 
         endpoint = self._supabase_endpoint(self.supabase_races_table)
         headers = self._supabase_headers(include_content_profile=False)
         params = {
-            "select": "id,start_time,payload,created_at",
+            # Standings only read the stored scoring response, so leave the
+            # original request (the full entry list) on the server.
+            "select": "id,start_time,response:payload->response,created_at",
             "series_id": f"eq.{series_id}",
             "order": "start_time.asc,created_at.asc",
         }
 
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(endpoint, params=params, headers=headers)
-            response.raise_for_status()
-            rows = response.json()
+        client = self._http_client()
+        response = client.get(endpoint, params=params, headers=headers)
+        response.raise_for_status()
+        rows = _decode_json(response)
 
         if isinstance(rows, list):
             return [row for row in rows if isinstance(row, dict)]
@@ -972,25 +1191,29 @@ class DataStore:
                 raw_count = candidate.get("toCount")
                 if isinstance(raw_count, int):
                     to_count = raw_count
-                elif isinstance(raw_count, str) and raw_count.strip().isdigit():
-                    to_count = int(raw_count.strip())
+                elif isinstance(raw_count, str) and (stripped := raw_count.strip()).isdigit():
+                    to_count = int(stripped)
             if count_all is None:
                 raw_all = candidate.get("countAll")
                 if isinstance(raw_all, bool):
                     count_all = raw_all
                 elif isinstance(raw_all, str):
                     lowered = raw_all.strip().lower()
-                    if lowered in {"true", "1", "yes", "y"}:
+                    if lowered in _TRUTHY_STRINGS:
                         count_all = True
-                    elif lowered in {"false", "0", "no", "n"}:
+                    elif lowered in _FALSY_STRINGS:
                         count_all = False
+            if to_count is not None and count_all is not None:
+                break
 
         return to_count, count_all
 
     def fetch_series_standings(self, series_id: str) -> Dict[str, Any]:
-        if not (self.supabase_url and self.supabase_key):
+        if not self._supabase_enabled:
             raise RuntimeError("Supabase is not configured")
 
+        # The races query only needs the series id, so overlap it with the series lookup.
+        races_future = self._fetch_executor().submit(self._fetch_series_races, series_id)
         series_record = self._fetch_series_record(series_id)
         if not series_record:
             raise ValueError("Series not found")
@@ -999,7 +1222,7 @@ class DataStore:
         metadata = series_record.get("metadata") if isinstance(series_record.get("metadata"), dict) else {}
         to_count_override, count_all_override = self._series_settings_from_metadata(metadata)
 
-        races = self._fetch_series_races(series_id)
+        races = races_future.result()
 
         race_items: List[Dict[str, Any]] = []
         competitors: Dict[str, Dict[str, Any]] = {}
@@ -1008,10 +1231,7 @@ class DataStore:
             race_id = str(race.get("id") or "").strip()
             if not race_id:
                 continue
-            payload = race.get("payload")
-            if not isinstance(payload, dict):
-                continue
-            response_payload = payload.get("response")
+            response_payload = race.get("response")
             if not isinstance(response_payload, dict):
                 continue
 
@@ -1033,39 +1253,33 @@ class DataStore:
                 str(row.get("entryId")): row for row in personal_rows if row.get("entryId")
             }
 
-            entry_to_helm: Dict[str, str] = {}
-
+            # Personal ranks are credited while walking the PY rows. Every entry that maps
+            # to a helm is visited here, so the personal rows need no second pass.
             for index, row in enumerate(py_rows):
                 entry_id = str(row.get("entryId") or "").strip()
                 helm = str(row.get("helm") or "").strip()
                 if not helm:
                     continue
-                entry_to_helm[entry_id] = helm
 
                 competitor = competitors.setdefault(
                     helm,
                     {
                         "helm": helm,
-                        "boats": [],
-                        "boats_set": set(),
-                        "crews": [],
-                        "crews_set": set(),
+                        # Insertion-ordered dicts double as ordered sets of boats and crews.
+                        "boats": {},
+                        "crews": {},
                         "py_scores": {},
                         "personal_scores": {},
                     },
                 )
 
                 dinghy = str(row.get("dinghy") or "").strip()
-                if dinghy and dinghy not in competitor["boats_set"]:
-                    competitor["boats_set"].add(dinghy)
-                    competitor["boats"].append(dinghy)
+                if dinghy:
+                    competitor["boats"].setdefault(dinghy)
 
                 crew = str(row.get("crew") or "").strip()
                 if crew:
-                    crew_label = f"{crew} ({dinghy})" if dinghy else crew
-                    if crew_label not in competitor["crews_set"]:
-                        competitor["crews_set"].add(crew_label)
-                        competitor["crews"].append(crew_label)
+                    competitor["crews"].setdefault(f"{crew} ({dinghy})" if dinghy else crew)
 
                 rank_value = row.get("rank")
                 if rank_value is None:
@@ -1077,17 +1291,6 @@ class DataStore:
                     personal_rank = personal_row.get("rank")
                     competitor["personal_scores"][race_id] = float(personal_rank) if personal_rank is not None else None
 
-            for entry_id, personal_row in personal_by_entry.items():
-                helm = entry_to_helm.get(entry_id)
-                if not helm:
-                    continue
-                competitor = competitors.get(helm)
-                if competitor is None:
-                    continue
-                if race_id not in competitor["personal_scores"]:
-                    personal_rank = personal_row.get("rank")
-                    competitor["personal_scores"][race_id] = float(personal_rank) if personal_rank is not None else None
-
         race_count = len(race_items)
         competitor_count = len(competitors)
         dnc_value = competitor_count + 1 if competitor_count else 1
@@ -1107,27 +1310,31 @@ class DataStore:
         if to_count < 0:
             to_count = 0
 
+        # Scores were stored as floats during ingest, so only the DNC fallback needs converting.
+        dnc_score = float(dnc_value)
+        race_ids = [race["id"] for race in race_items]
+
         def _build_scores(score_map: Dict[str, Optional[float]]) -> Dict[str, Any]:
             per_race: List[Dict[str, Any]] = []
             numeric_scores: List[Tuple[float, int]] = []
 
-            for idx, race in enumerate(race_items):
-                value = score_map.get(race["id"])
+            for idx, race_id in enumerate(race_ids):
+                value = score_map.get(race_id)
                 if value is None:
-                    numeric_value = float(dnc_value)
+                    numeric_value = dnc_score
                     per_race.append({"value": None, "isDnc": True, "counted": False})
                 else:
-                    numeric_value = float(value)
+                    numeric_value = value
                     per_race.append({"value": numeric_value, "isDnc": False, "counted": False})
                 numeric_scores.append((numeric_value, idx))
 
             counting_slots = min(to_count, len(race_items))
             if counting_slots > 0:
-                numeric_scores.sort(key=lambda item: item[0])
-                counted_indexes = {idx for _, idx in numeric_scores[:counting_slots]}
+                best_scores = heapq.nsmallest(counting_slots, numeric_scores, key=itemgetter(0))
+                counted_indexes = {idx for _, idx in best_scores}
                 for idx in counted_indexes:
                     per_race[idx]["counted"] = True
-                total = sum(score for score, _ in numeric_scores[:counting_slots])
+                total = sum(score for score, _ in best_scores)
             else:
                 counted_indexes = set()
                 total = None
@@ -1146,11 +1353,13 @@ class DataStore:
         personal_competitors: List[Dict[str, Any]] = []
 
         for data in competitors.values():
+            boats = list(data["boats"])
+            crews = list(data["crews"])
             py_scores = _build_scores(data["py_scores"])
             competitor_entry = {
                 "helm": data["helm"],
-                "boats": data["boats"],
-                "crews": data["crews"],
+                "boats": boats,
+                "crews": crews,
                 "scores": py_scores,
             }
             py_competitors.append(competitor_entry)
@@ -1158,8 +1367,8 @@ class DataStore:
             personal_scores = _build_scores(data["personal_scores"])
             personal_entry = {
                 "helm": data["helm"],
-                "boats": data["boats"],
-                "crews": data["crews"],
+                "boats": boats,
+                "crews": crews,
                 "scores": personal_scores,
             }
             personal_competitors.append(personal_entry)
@@ -1220,7 +1429,7 @@ class DataStore:
         series_summaries = {series_id: self._series_summary(series_id) for series_id in series_ids}
 
         records: List[Dict[str, Any]]
-        if self.supabase_url and self.supabase_key and self.supabase_series_entries_table:
+        if self._series_entries_enabled:
             records = self._create_series_entries_supabase(user_id, prepared)
         else:
             records = self._create_series_entries_local(user_id, prepared)
@@ -1331,7 +1540,7 @@ class DataStore:
             race_records.append({"id": race_id, "snapshot": snapshot})
 
         records_signon: List[Dict[str, Any]]
-        if self.supabase_url and self.supabase_key and self.supabase_series_signons_table:
+        if self._series_signons_enabled:
             records_signon = self._create_race_signons_supabase(
                 user_id,
                 series_id,
@@ -1434,7 +1643,7 @@ class DataStore:
         for item in entries:
             payload.append(
                 {
-                    "id": str(uuid.uuid4()),
+                    "id": _new_record_id(),
                     "series_id": item["series_id"],
                     "submitted_by": user_id,
                     "helm_profile_id": item["helm_profile_id"],
@@ -1448,10 +1657,10 @@ class DataStore:
             )
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(endpoint, params={"select": "*"}, json=payload, headers=headers)
-                response.raise_for_status()
-                rows = response.json()
+            client = self._http_client()
+            response = client.post(endpoint, params={"select": "*"}, content=orjson.dumps(payload), headers=headers)
+            response.raise_for_status()
+            rows = _decode_json(response)
         except httpx.HTTPStatusError as exc:
             status_code = exc.response.status_code if exc.response else None
             if status_code == 404:
@@ -1486,7 +1695,7 @@ class DataStore:
         created: List[Dict[str, Any]] = []
         for item in entries:
             record = {
-                "id": str(uuid.uuid4()),
+                "id": _new_record_id(),
                 "series_id": item["series_id"],
                 "submitted_by": user_id,
                 "helm_profile_id": item["helm_profile_id"],
@@ -1518,31 +1727,28 @@ class DataStore:
         headers = self._supabase_headers("return=representation")
         headers["Content-Type"] = "application/json"
 
-        now_iso = self._utc_now_iso()
-        payload = []
-        for race in race_records:
-            payload.append(
-                {
-                    "id": str(uuid.uuid4()),
-                    "series_id": series_id,
-                    "scheduled_race_id": race["id"],
-                    "submitted_by": user_id,
-                    "helm_profile_id": helm_profile_id,
-                    "helm_name": helm_name,
-                    "crew_json": crew,
-                    "boat_class": boat_class,
-                    "sail_number": sail_number,
-                    "notes": notes,
-                    "race_snapshot": race.get("snapshot"),
-                    "created_at": now_iso,
-                }
-            )
+        # Everything but the id and the race columns is shared by the whole sign-on batch.
+        base = {
+            "series_id": series_id,
+            "submitted_by": user_id,
+            "helm_profile_id": helm_profile_id,
+            "helm_name": helm_name,
+            "crew_json": crew,
+            "boat_class": boat_class,
+            "sail_number": sail_number,
+            "notes": notes,
+            "created_at": self._utc_now_iso(),
+        }
+        payload = [
+            {**base, "id": _new_record_id(), "scheduled_race_id": race["id"], "race_snapshot": race.get("snapshot")}
+            for race in race_records
+        ]
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(endpoint, params={"select": "*"}, json=payload, headers=headers)
-                response.raise_for_status()
-                rows = response.json()
+            client = self._http_client()
+            response = client.post(endpoint, params={"select": "*"}, content=orjson.dumps(payload), headers=headers)
+            response.raise_for_status()
+            rows = _decode_json(response)
         except httpx.HTTPStatusError as exc:
             status_code = exc.response.status_code if exc.response else None
             if status_code == 404:
@@ -1610,49 +1816,54 @@ class DataStore:
         data = self._read_json_file(self.local_series_signons_path, [])
         if not isinstance(data, list):
             data = []
-        now_iso = self._utc_now_iso()
-        created: List[Dict[str, Any]] = []
-        for race in race_records:
-            record = {
-                "id": str(uuid.uuid4()),
-                "series_id": series_id,
-                "scheduled_race_id": race["id"],
-                "submitted_by": user_id,
-                "helm_profile_id": helm_profile_id,
-                "helm_name": helm_name,
-                "crew_json": crew,
-                "boat_class": boat_class,
-                "sail_number": sail_number,
-                "notes": notes,
-                "race_snapshot": race.get("snapshot"),
-                "created_at": now_iso,
-            }
-            data.append(record)
-            created.append(record)
+        base = {
+            "series_id": series_id,
+            "submitted_by": user_id,
+            "helm_profile_id": helm_profile_id,
+            "helm_name": helm_name,
+            "crew_json": crew,
+            "boat_class": boat_class,
+            "sail_number": sail_number,
+            "notes": notes,
+            "created_at": self._utc_now_iso(),
+        }
+        created = [
+            {**base, "id": _new_record_id(), "scheduled_race_id": race["id"], "race_snapshot": race.get("snapshot")}
+            for race in race_records
+        ]
+        data.extend(created)
         self._write_json_file(self.local_series_signons_path, data)
         return created
 
     def _series_summary(self, series_id: str) -> Dict[str, Any]:
         if not series_id:
             return {"id": ""}
+        return self._cached(
+            ("series", "summary", series_id),
+            SERIES_CACHE_TTL,
+            lambda: self._lookup_series_summary(series_id),
+        )
 
+    def _lookup_series_summary(self, series_id: str) -> Dict[str, Any] | _Uncached:
         record = self._fetch_series_record(series_id)
         if record:
             return self._normalise_series_row(record)
 
+        # Only Supabase hits are cached; a series that is missing or only local
+        # may appear there at any moment.
         local_data = self._read_json_file(self.local_series_path, [])
         if isinstance(local_data, list):
             for row in local_data:
                 if isinstance(row, dict) and str(row.get("id")) == series_id:
-                    return self._normalise_series_row(row)
+                    return _Uncached(self._normalise_series_row(row))
 
-        return {"id": series_id, "code": "", "title": "", "startDate": None, "endDate": None}
+        return _Uncached({"id": series_id, "code": "", "title": "", "startDate": None, "endDate": None})
 
     def _normalise_crew_list(self, raw: Any) -> List[Dict[str, Any]]:
         if isinstance(raw, str):
             try:
-                raw = json.loads(raw)
-            except json.JSONDecodeError:
+                raw = orjson.loads(raw)
+            except orjson.JSONDecodeError:
                 raw = []
         if not isinstance(raw, list):
             return []
@@ -1696,13 +1907,15 @@ class DataStore:
         crew = self._normalise_crew_list(record.get("crew_json") or record.get("crew"))
 
         race_snapshot = record.get("race_snapshot")
-        if isinstance(race_snapshot, str):
-            try:
-                race_snapshot = json.loads(race_snapshot)
-            except json.JSONDecodeError:
-                race_snapshot = {}
         if not isinstance(race_snapshot, dict):
-            race_snapshot = {}
+            # PostgREST returns the jsonb column parsed; only legacy text rows need decoding.
+            if isinstance(race_snapshot, str):
+                try:
+                    race_snapshot = orjson.loads(race_snapshot)
+                except orjson.JSONDecodeError:
+                    race_snapshot = {}
+            if not isinstance(race_snapshot, dict):
+                race_snapshot = {}
 
         label = race_snapshot.get("label") or race_summary.get("race") or race_summary.get("label") or ""
         date_value = race_snapshot.get("date") or race_summary.get("date") or ""
@@ -1736,8 +1949,12 @@ class DataStore:
         }
 
     def _series_code(self, series: str) -> str:
-        canonical = re.sub(r"[^A-Z0-9]+", "", series.upper()) if series else ""
-        return canonical[:12] if canonical else ""
+        if not series:
+            return ""
+        upper = series.upper()
+        if upper.isascii():
+            return upper.translate(_SERIES_CODE_ASCII_DELETE)[:12]
+        return _SERIES_CODE_STRIP_RE.sub("", upper)[:12]
 
     def _series_record_for_create(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         title = str(payload.get("title") or "").strip()
@@ -1821,36 +2038,13 @@ class DataStore:
         raise ValueError("Invalid date value")
 
     def _normalise_series_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
-        metadata = row.get("metadata") if isinstance(row.get("metadata"), dict) else {}
-        code = metadata.get("code") or row.get("code") or ""
-        title = metadata.get("title") or row.get("title") or ""
-
-        start_raw = (
-            metadata.get("startDate")
-            or metadata.get("start_date")
-            or row.get("start_date")
-        )
-        if isinstance(start_raw, dt.date):
-            start_date = start_raw.isoformat()
-        elif isinstance(start_raw, str) and start_raw:
-            start_date = start_raw[:10]
-        else:
-            start_date = None
-
-        end_raw = metadata.get("endDate") or metadata.get("end_date") or row.get("end_date")
-        if isinstance(end_raw, dt.date):
-            end_date = end_raw.isoformat()
-        elif isinstance(end_raw, str) and end_raw:
-            end_date = end_raw[:10]
-        else:
-            end_date = None
-
+        metadata = raw_metadata if isinstance(raw_metadata := row.get("metadata"), dict) else {}
         return {
             "id": str(row.get("id")),
-            "code": code,
-            "title": title,
-            "startDate": start_date,
-            "endDate": end_date,
+            "code": metadata.get("code") or row.get("code") or "",
+            "title": metadata.get("title") or row.get("title") or "",
+            "startDate": _date_prefix(metadata.get("startDate") or metadata.get("start_date") or row.get("start_date")),
+            "endDate": _date_prefix(metadata.get("endDate") or metadata.get("end_date") or row.get("end_date")),
         }
 
     def _schedule_record_from_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -1914,13 +2108,7 @@ class DataStore:
 
         race_officer = metadata.get("raceOfficer") or metadata.get("race_officer") or row.get("race_officer")
 
-        date_value = metadata.get("date") or row.get("date")
-        if isinstance(date_value, dt.date):
-            date_str = date_value.isoformat()
-        elif isinstance(date_value, str):
-            date_str = date_value[:10]
-        else:
-            date_str = ""
+        date_str = _date_prefix(metadata.get("date") or row.get("date")) or ""
 
         start_time_value = metadata.get("startTime") or metadata.get("start_time") or row.get("start_time")
         if isinstance(start_time_value, dt.datetime):
@@ -1960,23 +2148,36 @@ class DataStore:
         try:
             if not path.exists():
                 return default
-            with path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
-        except (OSError, json.JSONDecodeError) as exc:
+            return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as exc:
             logger.warning("Falling back to default for %s due to read error: %s", path, exc)
             return default
 
     def _write_json_file(self, path: Path, data: Any) -> None:
+        """Replace ``path`` atomically with ``data``, skipping the write when nothing changed."""
+        serialised = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        tmp_path: Path | None = None
         try:
+            if path.exists() and path.stat().st_size == len(serialised) and path.read_bytes() == serialised:
+                return
             path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2, sort_keys=True)
+            # A unique temp file per write: concurrent writers must not share one.
+            with tempfile.NamedTemporaryFile(
+                dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+            ) as handle:
+                tmp_path = Path(handle.name)
+                handle.write(serialised)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, path)
         except OSError as exc:
+            if tmp_path is not None:
+                self._remove_local_file(tmp_path)
             raise RuntimeError(f"Failed to write local data store {path}") from exc
 
     @staticmethod
     def _utc_now_iso() -> str:
-        return dt.datetime.now(dt.UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        return dt.datetime.now(dt.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     def _series_select_fields(self) -> str:
         fields = ["id", "code", "title", "start_date", "end_date"]
@@ -1991,11 +2192,8 @@ class DataStore:
         filtered.pop("metadata", None)
         return filtered
 
-    def _handle_series_metadata_error(self, response: httpx.Response | None) -> bool:
-        if not self._series_supports_metadata:
-            return False
-        detail = self._extract_supabase_detail(response)
-        if not detail:
+    def _handle_series_metadata_error(self, detail: str | None) -> bool:
+        if not self._series_supports_metadata or not detail:
             return False
         message = detail.lower()
         if "metadata" in message and "column" in message:
@@ -2019,7 +2217,7 @@ class DataStore:
             if code_value == record["code"]:
                 raise ValueError("Series code already exists")
 
-        entry = {"id": str(uuid.uuid4()), **record}
+        entry = {"id": _new_record_id(), **record}
         data.append(entry)
         self._write_json_file(self.local_series_path, data)
         return self._normalise_series_row(entry)
@@ -2090,7 +2288,7 @@ class DataStore:
 
     def _create_scheduled_race_local(self, record: Dict[str, Any]) -> Dict[str, Any]:
         data = self._read_json_file(self.local_schedule_path, [])
-        entry = {"id": str(uuid.uuid4()), **record}
+        entry = {"id": _new_record_id(), **record}
         data.append(entry)
         try:
             data.sort(key=lambda row: (
@@ -2106,10 +2304,11 @@ class DataStore:
     # ------------------------------------------------------------------
     # Local backlog synchronisation helpers
 
+    @_invalidates("series", "schedule")
     def sync_local_backlog(self) -> Dict[str, Any]:
         """Push locally cached series and scheduled races to Supabase."""
 
-        if not (self.supabase_url and self.supabase_key):
+        if not self._supabase_enabled:
             raise RuntimeError("Supabase configuration is required to sync local backlog")
 
         summary = {
@@ -2162,26 +2361,17 @@ class DataStore:
             result["remaining"] = len(remaining)
             return result
 
-        with httpx.Client(timeout=10.0) as client:
-            for row in rows:
-                try:
-                    record = self._series_record_from_local(row)
-                except ValueError as exc:
-                    remaining.append(row)
-                    result["errors"].append(str(exc))
-                    continue
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        for row in rows:
+            try:
+                pending.append((row, self._series_record_from_local(row)))
+            except ValueError as exc:
+                remaining.append(row)
+                result["errors"].append(str(exc))
 
-                try:
-                    self._upsert_series_remote(client, record)
-                except httpx.HTTPStatusError as exc:
-                    detail = self._extract_supabase_detail(exc.response)
-                    remaining.append(row)
-                    result["errors"].append(detail or f"Supabase rejected series sync: {exc}")
-                except httpx.HTTPError as exc:
-                    remaining.append(row)
-                    result["errors"].append(f"Series sync request failed: {exc}")
-                else:
-                    result["synced"] += 1
+        self._sync_backlog_batches(
+            self._http_client(), pending, self._upsert_series_remote, "series", "code", result, remaining
+        )
 
         if remaining:
             self._write_json_file(self.local_series_path, remaining)
@@ -2225,22 +2415,88 @@ class DataStore:
 
         return record
 
-    def _upsert_series_remote(self, client: httpx.Client, record: Dict[str, Any]) -> None:
+    def _sync_backlog_batches(
+        self,
+        client: httpx.Client,
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        upsert: Callable[[httpx.Client, List[Dict[str, Any]]], None],
+        label: str,
+        conflict_key: str,
+        result: Dict[str, Any],
+        remaining: List[Any],
+    ) -> None:
+        """Upsert ``(row, record)`` pairs in bulk, retrying a rejected batch row by row.
+
+        PostgREST rejects a bulk upsert that names the same ``conflict_key`` twice,
+        so only the last local row for each key is sent; the rows it supersedes
+        stay in the backlog only if it does. Records are grouped by key set, since
+        bulk inserts require every object to share the same keys. Once Supabase
+        itself fails (a transport error or a 5xx), the rest of the backlog is kept
+        locally without further requests.
+        """
+
+        latest: Dict[Any, Tuple[List[Dict[str, Any]], Dict[str, Any]]] = {}
+        for row, record in pending:
+            key = record.get(conflict_key)
+            if key is None:
+                key = object()  # no conflict target: never merged with another row
+            superseded, _ = latest.pop(key, ([], None))
+            latest[key] = ([*superseded, row], record)
+
+        groups: Dict[frozenset, List[Tuple[List[Dict[str, Any]], Dict[str, Any]]]] = {}
+        for item in latest.values():
+            groups.setdefault(frozenset(item[1]), []).append(item)
+
+        queue = deque(
+            group[start:start + SYNC_BATCH_SIZE]
+            for group in groups.values()
+            for start in range(0, len(group), SYNC_BATCH_SIZE)
+        )
+        unavailable = False
+        skipped = 0
+        while queue:
+            batch = queue.popleft()
+            if unavailable:
+                remaining.extend(row for rows, _ in batch for row in rows)
+                skipped += len(batch)
+                continue
+            try:
+                upsert(client, [record for _, record in batch])
+            except httpx.HTTPStatusError as exc:
+                status_code = exc.response.status_code if exc.response is not None else None
+                unavailable = status_code is None or status_code >= 500
+                if len(batch) > 1 and not unavailable:
+                    # Isolate the offending rows so the rest of the batch still syncs.
+                    queue.extendleft([item] for item in reversed(batch))
+                    continue
+                detail = self._extract_supabase_detail(exc.response)
+                remaining.extend(row for rows, _ in batch for row in rows)
+                result["errors"].append(detail or f"Supabase rejected {label} sync: {exc}")
+            except httpx.HTTPError as exc:
+                unavailable = True
+                remaining.extend(row for rows, _ in batch for row in rows)
+                result["errors"].append(f"{label.capitalize()} sync request failed: {exc}")
+            else:
+                result["synced"] += len(batch)
+
+        if skipped:
+            result["errors"].append(f"Skipped {skipped} {label} rows after Supabase failed")
+
+    def _upsert_series_remote(self, client: httpx.Client, records: List[Dict[str, Any]]) -> None:
         endpoint = self._supabase_endpoint(self.supabase_series_table)
-        headers = self._supabase_headers("resolution=merge-duplicates,return=representation")
-        headers["Content-Type"] = "application/json"
+        headers = self._upsert_headers
         params = {"on_conflict": "code"}
 
         while True:
-            payload_for_supabase = self._prepare_series_payload(record)
+            payload_for_supabase = [self._prepare_series_payload(record) for record in records]
             try:
-                response = client.post(endpoint, params=params, json=[payload_for_supabase], headers=headers)
-                if response.status_code == 409:  # Already exists with same data
+                response = client.post(endpoint, params=params, content=orjson.dumps(payload_for_supabase), headers=headers)
+                if response.status_code == 409 and len(records) == 1:  # Already exists with same data
                     return
                 response.raise_for_status()
                 return
             except httpx.HTTPStatusError as exc:
-                if self._handle_series_metadata_error(exc.response):
+                if self._handle_series_metadata_error(self._extract_supabase_detail(exc.response)):
                     continue
                 raise
 
@@ -2271,26 +2527,17 @@ class DataStore:
             result["remaining"] = len(remaining)
             return result
 
-        with httpx.Client(timeout=10.0) as client:
-            for row in rows:
-                try:
-                    record = self._schedule_record_from_local(row)
-                except ValueError as exc:
-                    remaining.append(row)
-                    result["errors"].append(str(exc))
-                    continue
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        for row in rows:
+            try:
+                pending.append((row, self._schedule_record_from_local(row)))
+            except ValueError as exc:
+                remaining.append(row)
+                result["errors"].append(str(exc))
 
-                try:
-                    self._upsert_schedule_remote(client, record)
-                except httpx.HTTPStatusError as exc:
-                    detail = self._extract_supabase_detail(exc.response)
-                    remaining.append(row)
-                    result["errors"].append(detail or f"Supabase rejected schedule sync: {exc}")
-                except httpx.HTTPError as exc:
-                    remaining.append(row)
-                    result["errors"].append(f"Schedule sync request failed: {exc}")
-                else:
-                    result["synced"] += 1
+        self._sync_backlog_batches(
+            self._http_client(), pending, self._upsert_schedule_remote, "schedule", "id", result, remaining
+        )
 
         if remaining:
             self._write_json_file(self.local_schedule_path, remaining)
@@ -2301,7 +2548,7 @@ class DataStore:
         return result
 
     def _schedule_record_from_local(self, row: Dict[str, Any]) -> Dict[str, Any]:
-        metadata = row.get("metadata") if isinstance(row.get("metadata"), dict) else {}
+        metadata = raw_metadata if isinstance(raw_metadata := row.get("metadata"), dict) else {}
 
         series_code = row.get("series_code") or metadata.get("seriesCode") or self._series_code(metadata.get("series"))
         if not series_code:
@@ -2332,22 +2579,17 @@ class DataStore:
         }
 
         record_id = row.get("id") or metadata.get("id")
-        if record_id:
-            record["id"] = str(record_id)
-        else:
-            generated = str(uuid.uuid4())
-            record["id"] = generated
+        record["id"] = str(record_id) if record_id else _new_record_id()
 
         return record
 
-    def _upsert_schedule_remote(self, client: httpx.Client, record: Dict[str, Any]) -> None:
+    def _upsert_schedule_remote(self, client: httpx.Client, records: List[Dict[str, Any]]) -> None:
         endpoint = self._supabase_endpoint(self.supabase_schedule_table)
-        headers = self._supabase_headers("resolution=merge-duplicates,return=representation")
-        headers["Content-Type"] = "application/json"
+        headers = self._upsert_headers
         params = {"on_conflict": "id"}
 
-        response = client.post(endpoint, params=params, json=[record], headers=headers)
-        if response.status_code == 409:
+        response = client.post(endpoint, params=params, content=orjson.dumps(records), headers=headers)
+        if response.status_code == 409 and len(records) == 1:
             return
         response.raise_for_status()
 
@@ -2363,7 +2605,7 @@ class DataStore:
         if response is None:
             return None
         try:
-            payload = response.json()
+            payload = _decode_json(response)
         except ValueError:
             text = (response.text or "").strip()
             return text or None
@@ -2384,12 +2626,8 @@ class DataStore:
 
     @staticmethod
     def _extract_missing_column_name(detail: str) -> str | None:
-        patterns = [
-            r"could not find the '([^']+)' column",
-            r"column\s+([\w\.]+)\s+does not exist",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, detail, flags=re.IGNORECASE)
+        for pattern in _MISSING_COLUMN_PATTERNS:
+            match = pattern.search(detail)
             if match:
                 column = match.group(1)
                 if column:
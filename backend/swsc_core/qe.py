@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Dict, Iterable
 
 
-@dataclass
+@dataclass(slots=True)
 class QE:
     """Quick entry details for a helm/crew pairing."""
 
@@ -36,10 +36,10 @@ class QE:
 
         code, helm, crew, dinghy, sailno, personal, age_group, fleet = tokens
 
-        if dinghy not in classes:
+        py = classes.get(dinghy)
+        if py is None:
             raise ValueError(f"unknown class '{dinghy}' for QE {code}")
 
-        py = classes[dinghy]
         try:
             personal_val = int(personal) if personal else 0
         except ValueError as exc:
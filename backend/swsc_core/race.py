@@ -1,12 +1,55 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from itertools import groupby
+from operator import attrgetter
 from typing import Iterable, List, Sequence
 
 from .entry import Entry
 
 
-@dataclass
+def _table_header(headers: Sequence[str]) -> str:
+    return "<tr>" + "".join(f"<th>{header}</th>" for header in headers) + "</tr>"
+
+
+def _td(value) -> str:
+    display = "" if value is None else value
+    return f"<td>{display}</td>"
+
+
+_STYLE = """<style>
+            th{
+                font-size: 12px;
+                border: 1px solid black;
+                text-align: center;
+                padding: 2px;
+            }
+            table {border-collapse: collapse;}
+            table#PY tr:nth-child(odd) td{background-color: #f2f2f2;}
+            table#personal tr:nth-child(even) td{background-color: #a2a2a2;}
+            table#personal {float: left; margin-left: 16px; }
+            table#PY {float: left;}
+            td {
+                text-align: center;
+                font-size: 12px;
+                border: 1px solid black;
+                padding: 2px;
+            }
+        </style>"""
+
+# The static parts of the results page are rendered once at import; only the
+# rows are formatted per race.
+_HTML_HEAD = "<html><head>" + _STYLE + "</head><body>"
+_PY_TABLE_OPEN = "<table id='PY'>" + _table_header(
+    ["Entry ID", "Helm/<br>Crew", "Class", "PY", "Laps", "Time", "Corrected", "Rank"]
+)
+_PERSONAL_TABLE_OPEN = "</table><table id='personal'>" + _table_header(
+    ["Helm/<br>Crew", "Personal<br>Handicap", "Corrected", "Rank"]
+)
+_HTML_TAIL = "</table></body></html>"
+
+
+@dataclass(slots=True)
 class PyRow:
     entry_id: str
     helm: str
@@ -20,7 +63,7 @@ class PyRow:
     fin_code: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonalRow:
     entry_id: str
     helm: str
@@ -30,7 +73,7 @@ class PersonalRow:
     rank: float | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreResults:
     py_rows: List[PyRow] = field(default_factory=list)
     personal_rows: List[PersonalRow] = field(default_factory=list)
@@ -52,65 +95,63 @@ class Race:
         dnc = dnc_position or (len(self.entries) + 1)
 
         max_laps = max((entry.laps for entry in self.entries if entry.laps), default=0)
+        py_candidates: List[Entry] = []
+        personal_candidates: List[Entry] = []
         for entry in self.entries:
             entry.calculate_corrected(max_laps)
             if entry.fin_code:
                 entry.py_place = dnc
                 entry.personal_place = dnc
-
-        self._award_places(
-            [entry for entry in self.entries if not entry.fin_code and entry.corrected_py],
-            key=lambda e: e.corrected_py,
-            attr="py_place",
+                continue
+            if entry.corrected_py:
+                py_candidates.append(entry)
+            if not entry.personal:
+                # Without a personal handicap the entry is never ranked on it.
+                if entry.personal_place == 0:
+                    entry.personal_place = dnc
+            elif entry.corrected_personal:
+                personal_candidates.append(entry)
+
+        self._award_places(py_candidates, key=attrgetter("corrected_py"), attr="py_place")
+        self._award_places(personal_candidates, key=attrgetter("corrected_personal"), attr="personal_place")
+
+        py_order = sorted(self.entries, key=lambda e: e.py_place or dnc)
+        summary_lines = ["ID    Helm                Class     Time  Laps  Corrected Place"]
+        summary_lines.extend(
+            f"{entry.entry_id:<6}{entry.helm:<20}{entry.dinghy:<10}"
+            f"{entry.time_seconds!s:<6}{entry.laps!s:<6}{entry.corrected_py!s:<10}{entry.py_place}"
+            for entry in py_order
         )
-
-        personal_candidates = [
-            entry
-            for entry in self.entries
-            if not entry.fin_code and entry.corrected_personal and entry.personal
+        py_rows = [
+            PyRow(
+                entry_id=entry.entry_id,
+                helm=entry.helm,
+                crew=entry.crew,
+                dinghy=entry.dinghy,
+                py=entry.py,
+                laps=entry.laps,
+                time_seconds=entry.time_seconds,
+                corrected=entry.corrected_py or None,
+                rank=entry.py_place or None,
+                fin_code=entry.fin_code,
+            )
+            for entry in py_order
         ]
-        self._award_places(personal_candidates, key=lambda e: e.corrected_personal, attr="personal_place")
-        for entry in self.entries:
-            if entry.personal_place == 0 and (entry.fin_code or not entry.personal):
-                entry.personal_place = dnc
 
-        summary_lines = ["ID    Helm                Class     Time  Laps  Corrected Place"]
-        py_rows: List[PyRow] = []
-        personal_rows: List[PersonalRow] = []
-
-        for entry in sorted(self.entries, key=lambda e: e.py_place or dnc):
-            summary_lines.append(
-                f"{entry.entry_id.ljust(6)}{entry.helm.ljust(20)}{entry.dinghy.ljust(10)}"
-                f"{str(entry.time_seconds).ljust(6)}{str(entry.laps).ljust(6)}"
-                f"{str(entry.corrected_py).ljust(10)}{entry.py_place}"
-            )
-            py_rows.append(
-                PyRow(
-                    entry_id=entry.entry_id,
-                    helm=entry.helm,
-                    crew=entry.crew,
-                    dinghy=entry.dinghy,
-                    py=entry.py,
-                    laps=entry.laps,
-                    time_seconds=entry.time_seconds,
-                    corrected=entry.corrected_py or None,
-                    rank=entry.py_place or None,
-                    fin_code=entry.fin_code,
-                )
+        # Only entries with personal handicaps are listed, so drop the rest
+        # before sorting rather than after.
+        personal_entries = [entry for entry in self.entries if entry.personal]
+        personal_rows = [
+            PersonalRow(
+                entry_id=entry.entry_id,
+                helm=entry.helm,
+                crew=entry.crew,
+                personal_handicap=entry.personal,
+                corrected=entry.corrected_personal or None,
+                rank=entry.personal_place or None,
             )
-
-        for entry in sorted(self.entries, key=lambda e: e.personal_place or dnc):
-            if entry.personal:  # Only include entries with personal handicaps
-                personal_rows.append(
-                    PersonalRow(
-                        entry_id=entry.entry_id,
-                        helm=entry.helm,
-                        crew=entry.crew,
-                        personal_handicap=entry.personal,
-                        corrected=entry.corrected_personal or None,
-                        rank=entry.personal_place or None,
-                    )
-                )
+            for entry in sorted(personal_entries, key=lambda e: e.personal_place or dnc)
+        ]
 
         html = self._build_html(py_rows, personal_rows)
         summary_text = "\n".join(summary_lines)
@@ -122,14 +163,8 @@ class Race:
             return
         entries.sort(key=key)
         place = 1
-        idx = 0
-        while idx < len(entries):
-            current = entries[idx]
-            tie_group = [current]
-            idx += 1
-            while idx < len(entries) and key(entries[idx]) == key(current):
-                tie_group.append(entries[idx])
-                idx += 1
+        for _, group in groupby(entries, key=key):
+            tie_group = list(group)
             tie_size = len(tie_group)
             place_value = float((place * tie_size + tie_size - 1) / tie_size)
             for entry in tie_group:
@@ -138,66 +173,22 @@ class Race:
 
     @staticmethod
     def _build_html(py_rows: List[PyRow], personal_rows: List[PersonalRow]) -> str:
-        def table_header(headers: List[str]) -> str:
-            return "<tr>" + "".join(f"<th>{header}</th>" for header in headers) + "</tr>"
-
-        def td(value) -> str:
-            display = "" if value is None else value
-            return f"<td>{display}</td>"
-
-        py_table = [
-            "<table id='PY'>",
-            table_header(["Entry ID", "Helm/<br>Crew", "Class", "PY", "Laps", "Time", "Corrected", "Rank"]),
-        ]
+        parts = [_HTML_HEAD, _PY_TABLE_OPEN]
         for row in py_rows:
-            corrected_value = row.fin_code if row.fin_code else row.corrected
-            py_table.append(
-                "<tr>"
-                + td(row.entry_id)
-                + td(f"{row.helm}<br>{row.crew}")
-                + td(row.dinghy)
-                + td(row.py)
-                + td(row.laps)
-                + td(row.time_seconds)
-                + td(corrected_value)
-                + td(row.rank or "")
-                + "</tr>"
+            cells = (
+                row.entry_id,
+                f"{row.helm}<br>{row.crew}",
+                row.dinghy,
+                row.py,
+                row.laps,
+                row.time_seconds,
+                row.fin_code if row.fin_code else row.corrected,
+                row.rank or "",
             )
-        py_table.append("</table>")
-
-        personal_table = [
-            "<table id='personal'>",
-            table_header(["Helm/<br>Crew", "Personal<br>Handicap", "Corrected", "Rank"]),
-        ]
+            parts.append(f"<tr>{''.join(map(_td, cells))}</tr>")
+        parts.append(_PERSONAL_TABLE_OPEN)
         for row in personal_rows:
-            personal_table.append(
-                "<tr>"
-                + td(f"{row.helm}<br>{row.crew}")
-                + td(row.personal_handicap)
-                + td(row.corrected or "")
-                + td(row.rank or "")
-                + "</tr>"
-            )
-        personal_table.append("</table>")
-
-        style = """<style>
-            th{
-                font-size: 12px;
-                border: 1px solid black;
-                text-align: center;
-                padding: 2px;
-            }
-            table {border-collapse: collapse;}
-            table#PY tr:nth-child(odd) td{background-color: #f2f2f2;}
-            table#personal tr:nth-child(even) td{background-color: #a2a2a2;}
-            table#personal {float: left; margin-left: 16px; }
-            table#PY {float: left;}
-            td {
-                text-align: center;
-                font-size: 12px;
-                border: 1px solid black;
-                padding: 2px;
-            }
-        </style>"""
-
-        return "<html><head>" + style + "</head><body>" + "".join(py_table + personal_table) + "</body></html>"
+            cells = (f"{row.helm}<br>{row.crew}", row.personal_handicap, row.corrected or "", row.rank or "")
+            parts.append(f"<tr>{''.join(map(_td, cells))}</tr>")
+        parts.append(_HTML_TAIL)
+        return "".join(parts)
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def supabase_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point DataStore at a fake Supabase project; tests patch httpx themselves."""
+
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key")
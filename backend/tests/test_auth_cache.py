@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import types
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+class _FakeAuthClient:
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.calls: List[str] = []
+
+    async def get(self, endpoint: str, headers: Dict[str, str]) -> httpx.Response:
+        self.calls.append(headers["Authorization"])
+        request = httpx.Request("GET", endpoint)
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, request=request, json={"message": "invalid JWT"})
+        return httpx.Response(200, request=request, json={"id": " user-1 ", "email": "a@example.com"})
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def token_cache(monkeypatch: pytest.MonkeyPatch) -> "OrderedDict[bytes, Any]":
+    cache: "OrderedDict[bytes, Any]" = OrderedDict()
+    monkeypatch.setattr(main, "_TOKEN_CACHE", cache)
+    return cache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    fake = _Clock()
+    # Only the app module's clock is replaced; asyncio keeps the real one.
+    monkeypatch.setattr(main, "time", types.SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+def _request_for(client: _FakeAuthClient) -> Any:
+    return types.SimpleNamespace(app=types.SimpleNamespace(state=types.SimpleNamespace(auth_client=client)))
+
+
+def test_cached_token_skips_auth_round_trip(monkeypatch: pytest.MonkeyPatch, supabase_env) -> None:
+    monkeypatch.setenv("SUPABASE_ANON_KEY", "anon-key")
+    client = _FakeAuthClient()
+    request = _request_for(client)
+
+    async def verify(*tokens: str) -> List[Dict[str, Any]]:
+        return [await main.require_user(request, f"Bearer {token}") for token in tokens]
+
+    users = asyncio.run(verify("token-1", "token-1", "token-2"))
+
+    assert [user["id"] for user in users] == ["user-1", "user-1", "user-1"]
+    assert client.calls == ["Bearer token-1", "Bearer token-2"]
+
+
+def test_cached_token_expires_after_ttl(clock: _Clock) -> None:
+    main._remember_user(b"key", {"id": "user-1"})
+
+    clock.now += main._TOKEN_CACHE_TTL - 1
+    assert main._cached_user(b"key") == {"id": "user-1"}
+
+    clock.now += 1
+    assert main._cached_user(b"key") is None
+    assert b"key" not in main._TOKEN_CACHE
+
+
+def test_token_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch, clock: _Clock, token_cache: "OrderedDict[bytes, Any]"
+) -> None:
+    monkeypatch.setattr(main, "_TOKEN_CACHE_MAXSIZE", 2)
+
+    main._remember_user(b"a", {"id": "a"})
+    main._remember_user(b"b", {"id": "b"})
+    assert main._cached_user(b"a") == {"id": "a"}  # "b" is now least recently used
+    main._remember_user(b"c", {"id": "c"})
+
+    assert list(token_cache) == [b"a", b"c"]
+    assert main._cached_user(b"b") is None
+
+
+def test_cached_user_is_isolated_from_callers(clock: _Clock) -> None:
+    payload = {"id": "user-1", "app_metadata": {"roles": ["member"]}}
+    main._remember_user(b"key", payload)
+    payload["app_metadata"]["roles"].append("stored-then-mutated")
+
+    first = main._cached_user(b"key")
+    first["app_metadata"]["roles"].append("admin")
+
+    assert main._cached_user(b"key") == {"id": "user-1", "app_metadata": {"roles": ["member"]}}
+
+
+_SIGNON = {"seriesId": "series-1", "helmName": "Alice", "scheduledRaceIds": ["race-1"]}
+
+
+def test_portal_route_without_lifespan_reports_auth_unavailable(
+    monkeypatch: pytest.MonkeyPatch, supabase_env
+) -> None:
+    monkeypatch.setenv("SUPABASE_ANON_KEY", "anon-key")
+
+    # Not entered as a context manager, so lifespan never creates the auth client.
+    response = TestClient(main.app).post(
+        "/portal/signons", json=_SIGNON, headers={"Authorization": "Bearer token-1"}
+    )
+
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Authentication service is not available"}
+
+
+def test_portal_route_with_lifespan_rejects_invalid_token(
+    monkeypatch: pytest.MonkeyPatch, supabase_env
+) -> None:
+    monkeypatch.setenv("SUPABASE_ANON_KEY", "anon-key")
+    fake = _FakeAuthClient(status_code=401)
+
+    with TestClient(main.app) as client:
+        real = main.app.state.auth_client
+        main.app.state.auth_client = fake
+        try:
+            response = client.post("/portal/signons", json=_SIGNON, headers={"Authorization": "Bearer bad"})
+        finally:
+            main.app.state.auth_client = real
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid authentication token"}
+    assert fake.calls == ["Bearer bad"]
@@ -1,3 +1,6 @@
+import json
+import threading
+import time
 from typing import Any, Dict
 
 import pytest
@@ -13,18 +16,16 @@ class _DummyResponse:
     def raise_for_status(self) -> None:  # pragma: no cover - nothing to do
         return None
 
-    def json(self) -> Any:
-        return self._payload
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode()
 
 
 class _DummyClient:
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.calls: list[Dict[str, Any]] = []
 
-    def __enter__(self) -> "_DummyClient":
-        return self
-
-    def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - nothing to clean up
+    def close(self) -> None:
         return None
 
     def get(self, endpoint: str, params: Dict[str, Any], headers: Dict[str, str]) -> _DummyResponse:
@@ -126,3 +127,87 @@ def test_load_handicaps_with_empty_supabase_fails(monkeypatch: pytest.MonkeyPatc
     # Should raise RuntimeError when Supabase returns no data
     with pytest.raises(RuntimeError, match="Supabase query returned zero handicap rows"):
         store.load_handicaps()
+
+
+def test_fetch_supabase_users_reads_every_page(monkeypatch: pytest.MonkeyPatch, supabase_env) -> None:
+    monkeypatch.setattr(loader_module, "USERS_PAGE_SIZE", 2)
+
+    users = [{"id": f"user-{index}", "email": f"user{index}@example.com"} for index in range(5)]
+    requested_pages: list[int] = []
+
+    class _PagedClient(_DummyClient):
+        def get(self, endpoint: str, params: Dict[str, Any], headers: Dict[str, str]) -> Any:
+            page = params["page"]
+            requested_pages.append(page)
+            start = (page - 1) * params["per_page"]
+            request = loader_module.httpx.Request("GET", endpoint)
+            return loader_module.httpx.Response(
+                200,
+                request=request,
+                headers={"X-Total-Count": str(len(users))},
+                json={"users": users[start : start + params["per_page"]]},
+            )
+
+    monkeypatch.setattr(loader_module.httpx, "Client", _PagedClient)
+
+    store = DataStore()
+    result = store._fetch_supabase_users()
+    store.close()
+
+    assert list(result) == [user["id"] for user in users]
+    assert sorted(requested_pages) == [1, 2, 3]
+
+
+def test_supabase_requests_share_one_pooled_http2_client(monkeypatch: pytest.MonkeyPatch, supabase_env) -> None:
+    created: list[tuple[_DummyClient, Dict[str, Any]]] = []
+
+    class _RecordingClient(_DummyClient):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            created.append((self, kwargs))
+
+    monkeypatch.setattr(loader_module.httpx, "Client", _RecordingClient)
+
+    store = DataStore()
+    store.load_handicaps()
+    store._handicaps = None  # force a second round trip
+    store.load_handicaps()
+
+    assert len(created) == 1
+    client, kwargs = created[0]
+    assert kwargs["http2"] is True
+    assert kwargs["limits"] is loader_module.HTTP_LIMITS
+    assert loader_module.HTTP_LIMITS.max_keepalive_connections
+    assert len(client.calls) == 2
+
+    store.close()
+    assert store._client is None
+
+
+def test_concurrent_first_use_builds_one_http_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[_DummyClient] = []
+    ready = threading.Barrier(2)
+
+    class _SlowClient(_DummyClient):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            time.sleep(0.05)  # widen the window between the None check and assignment
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(loader_module.httpx, "Client", _SlowClient)
+
+    store = DataStore()
+    seen: list[_DummyClient] = []
+
+    def first_use() -> None:
+        ready.wait()
+        seen.append(store._http_client())
+
+    threads = [threading.Thread(target=first_use) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert seen == [created[0], created[0]]
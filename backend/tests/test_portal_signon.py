@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
+import uuid
 from typing import Dict
 
 import pytest
@@ -51,6 +52,7 @@ def test_create_series_entries_local(store: DataStore) -> None:
     assert crew_names == {"Bob", "Charlie"}
     assert created["boatClass"] == "RS200"
     assert created["submittedBy"] == "user-123"
+    assert uuid.UUID(created["id"]).version == 7
 
 
 def test_create_race_signons_today_only(store: DataStore) -> None:
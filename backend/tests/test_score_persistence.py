@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi import BackgroundTasks
+from fastapi.testclient import TestClient
+
+from app import main
+
+PAYLOAD: Dict[str, Any] = {
+    "metadata": {
+        "series": "Spring Series",
+        "race": "Race 1",
+        "raceOfficer": "Bob",
+        "date": "2025-04-01",
+        "raceNumber": 1,
+        "startTime": "10:30",
+    },
+    "entries": [
+        {"helm": " Alice ", "crew": "Bob", "dinghy": "laser", "sailNumber": " 123 ", "laps": 3, "timeSeconds": 1800},
+        {"entry_id": "X1", "helm": "Dan", "crew": "", "dinghy": "LASER", "laps": 2, "timeSeconds": 1700, "finCode": "dnf"},
+    ],
+}
+
+
+class _FakeStore:
+    def __init__(self, error: Optional[Exception] = None) -> None:
+        self.error = error
+        self.persisted: List[tuple] = []
+
+    def load_handicaps(self) -> Dict[str, int]:
+        return {"LASER": 1100}
+
+    def persist_race(self, metadata, request_payload, response_payload, entries) -> None:
+        self.persisted.append((metadata, request_payload, response_payload, entries))
+        if self.error is not None:
+            raise self.error
+
+
+@pytest.fixture
+def fake_store(monkeypatch: pytest.MonkeyPatch) -> _FakeStore:
+    fake = _FakeStore()
+    monkeypatch.setattr(main, "store", lambda: fake)
+    return fake
+
+
+def test_score_defers_persistence_to_background_task(fake_store: _FakeStore) -> None:
+    tasks = BackgroundTasks()
+
+    main.score(main.ScoreRequest.model_validate(PAYLOAD), tasks)
+
+    assert fake_store.persisted == []
+    assert [task.func for task in tasks.tasks] == [main._persist_score]
+
+
+def test_score_persists_the_entries_it_reports(fake_store: _FakeStore) -> None:
+    response = TestClient(main.app).post("/score", json=PAYLOAD)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(fake_store.persisted) == 1
+    metadata, request_payload, response_payload, entries = fake_store.persisted[0]
+    assert response_payload == body
+    assert metadata["series"] == "Spring Series"
+    assert request_payload["entries"][1]["entry_id"] == "X1"
+    reported = sorted((row["entryId"], row["helm"]) for row in body["pyResults"])
+    assert sorted((entry["entry_id"], entry["helm"]) for entry in entries) == reported
+    assert {entry["entry_id"]: entry["sail_number"] for entry in entries} == {"SPRI001": "123", "X1": ""}
+
+
+def test_score_logs_persistence_failure(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    failing = _FakeStore(error=RuntimeError("supabase down"))
+    monkeypatch.setattr(main, "store", lambda: failing)
+
+    with caplog.at_level(logging.ERROR, logger="app.main"):
+        response = TestClient(main.app).post("/score", json=PAYLOAD)
+
+    assert response.status_code == 200
+    assert len(failing.persisted) == 1
+    [record] = [r for r in caplog.records if r.name == "app.main"]
+    assert record.getMessage() == "Failed to persist race data to Supabase"
+    assert record.exc_info[1] is failing.error
@@ -1,17 +1,34 @@
 from __future__ import annotations
 
-import typing as t
+import json
+import threading
 
-try:  # pragma: no cover - import guard for type checkers
-    import pytest  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - pytest always available at runtime
-    pytest = t.cast(t.Any, None)
+import pytest
 
 from swsc_core.loader import DataStore
 from swsc_core import loader as loader_module
 
 
-@pytest.fixture
+# Supabase error responses shared by the fake clients below; they are only read.
+_METADATA_MISSING_RESPONSE = loader_module.httpx.Response(
+    400,
+    request=loader_module.httpx.Request("GET", "https://example.supabase.co/rest/v1/series"),
+    json={"message": "Could not find the 'metadata' column of 'series' in the schema cache"},
+)
+_CODE_CONFLICT_RESPONSE = loader_module.httpx.Response(
+    409,
+    request=loader_module.httpx.Request("POST", "https://example.supabase.co/rest/v1/series"),
+    json={"message": "duplicate key value violates unique constraint \"series_code_key\""},
+)
+
+
+def _raise_for(response):
+    raise loader_module.httpx.HTTPStatusError(
+        response.reason_phrase, request=response.request, response=response
+    )
+
+
+@pytest.fixture(scope="module")
 def store() -> DataStore:
     return DataStore()
 
@@ -23,8 +40,9 @@ class _SeriesDummyResponse:
     def raise_for_status(self):  # pragma: no cover - satisfies DataStore contract
         return None
 
-    def json(self):
-        return self._payload
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
 
 
 def test_series_record_for_create_requires_title(store: DataStore):
@@ -115,10 +133,7 @@ def test_normalise_series_row_prefers_metadata(store: DataStore):
     }
 
 
-def test_fetch_series_handles_missing_metadata_column(tmp_path, monkeypatch):
-    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
-    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key")
-
+def test_fetch_series_handles_missing_metadata_column(tmp_path, monkeypatch, supabase_env):
     store = DataStore(data_dir=tmp_path)
 
     class MetadataClient:
@@ -127,22 +142,10 @@ def test_fetch_series_handles_missing_metadata_column(tmp_path, monkeypatch):
         def __init__(self, *args, **kwargs):
             pass
 
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):  # pragma: no cover - nothing to clean up
-            return None
-
         def get(self, endpoint, params, headers):
             MetadataClient.call_count += 1
-            request = loader_module.httpx.Request("GET", endpoint)
             if MetadataClient.call_count == 1:
-                response = loader_module.httpx.Response(
-                    400,
-                    request=request,
-                    json={"message": "Could not find the 'metadata' column of 'series' in the schema cache"},
-                )
-                raise loader_module.httpx.HTTPStatusError("Bad Request", request=request, response=response)
+                _raise_for(_METADATA_MISSING_RESPONSE)
             return _SeriesDummyResponse([
                 {
                     "id": "series-1",
@@ -169,10 +172,7 @@ def test_fetch_series_handles_missing_metadata_column(tmp_path, monkeypatch):
     ]
 
 
-def test_create_series_handles_missing_metadata_column(tmp_path, monkeypatch):
-    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
-    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key")
-
+def test_create_series_handles_missing_metadata_column(tmp_path, monkeypatch, supabase_env):
     store = DataStore(data_dir=tmp_path)
 
     class MetadataClient:
@@ -181,26 +181,16 @@ def test_create_series_handles_missing_metadata_column(tmp_path, monkeypatch):
         def __init__(self, *args, **kwargs):
             pass
 
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):  # pragma: no cover - nothing to clean up
-            return None
-
-        def post(self, endpoint, params, json, headers):
+        def post(self, endpoint, params, content, headers):
+            payload = json.loads(content)
             MetadataClient.call_count += 1
-            request = loader_module.httpx.Request("POST", endpoint)
             if MetadataClient.call_count == 1:
-                response = loader_module.httpx.Response(
-                    400,
-                    request=request,
-                    json={"message": "Could not find the 'metadata' column of 'series' in the schema cache"},
-                )
-                raise loader_module.httpx.HTTPStatusError("Bad Request", request=request, response=response)
-
-            assert "metadata" not in json
-            response_payload = dict(json)
+                _raise_for(_METADATA_MISSING_RESPONSE)
+
+            assert "metadata" not in payload
+            response_payload = dict(payload)
             response_payload.setdefault("id", "series-2")
+            request = loader_module.httpx.Request("POST", endpoint)
             return loader_module.httpx.Response(201, request=request, json=response_payload)
 
     MetadataClient.call_count = 0
@@ -219,90 +209,221 @@ def test_create_series_handles_missing_metadata_column(tmp_path, monkeypatch):
     assert created["endDate"] is None
 
 
-def test_create_series_conflict_from_supabase(tmp_path, monkeypatch):
-    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
-    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key")
-
+_CONFLICT_SAMPLE_ROW = {
+    "id": "abc-123",
+    "code": "AUTUMN",
+    "title": "Autumn Series",
+    "start_date": "2025-09-07",
+    "metadata": {
+        "code": "AUTUMN",
+        "title": "Autumn Series",
+        "startDate": "2025-09-07",
+    },
+}
+
+
+@pytest.mark.parametrize(
+    ("operation", "existing_rows", "write_method"),
+    [
+        (lambda store: store.create_series({"title": "Autumn Series", "startDate": "2025-09-07"}), [], "post"),
+        (lambda store: store.update_series("abc-123", {"title": "Autumn 2025"}), [_CONFLICT_SAMPLE_ROW], "patch"),
+    ],
+    ids=["create", "update"],
+)
+def test_series_write_conflict_from_supabase(
+    tmp_path, monkeypatch, supabase_env, operation, existing_rows, write_method
+):
     store = DataStore(data_dir=tmp_path)
+    writes: list[str] = []
 
     class ConflictClient:
         def __init__(self, *args, **kwargs):
             pass
 
-        def __enter__(self):
-            return self
+        def get(self, endpoint, params, headers):
+            return _SeriesDummyResponse(existing_rows)
 
-        def __exit__(self, exc_type, exc, tb):  # pragma: no cover - no cleanup needed
-            return None
+        def post(self, endpoint, params, content, headers):
+            writes.append("post")
+            _raise_for(_CODE_CONFLICT_RESPONSE)
 
-        def post(self, endpoint, params, json, headers):
-            request = loader_module.httpx.Request("POST", endpoint)
-            response = loader_module.httpx.Response(
-                409,
-                request=request,
-                json={
-                    "message": "duplicate key value violates unique constraint \"series_code_key\""
-                },
-            )
-            raise loader_module.httpx.HTTPStatusError("Conflict", request=request, response=response)
+        def patch(self, endpoint, params, content, headers):
+            writes.append("patch")
+            _raise_for(_CODE_CONFLICT_RESPONSE)
 
     monkeypatch.setattr(loader_module.httpx, "Client", ConflictClient)
 
     with pytest.raises(ValueError, match="Series code already exists"):
-        store.create_series({
-            "title": "Autumn Series",
-            "startDate": "2025-09-07",
-        })
+        operation(store)
 
+    assert writes == [write_method]
     assert not store.local_series_path.exists()
 
 
-def test_update_series_conflict_from_supabase(tmp_path, monkeypatch):
-    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
-    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key")
+def test_fetch_series_is_cached_until_series_changes(tmp_path, monkeypatch, supabase_env):
+    store = DataStore(data_dir=tmp_path)
 
+    class CountingClient:
+        get_count = 0
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def get(self, endpoint, params, headers):
+            CountingClient.get_count += 1
+            return _SeriesDummyResponse([
+                {"id": "series-1", "code": "AUT", "title": "Autumn", "start_date": "2025-09-07"}
+            ])
+
+        def post(self, endpoint, params, content, headers):
+            request = loader_module.httpx.Request("POST", endpoint)
+            return loader_module.httpx.Response(201, request=request, json=[dict(json.loads(content), id="series-2")])
+
+    CountingClient.get_count = 0
+    monkeypatch.setattr(loader_module.httpx, "Client", CountingClient)
+
+    first = store.fetch_series()
+    first[0]["title"] = "Changed by caller"
+    assert store.fetch_series()[0]["title"] == "Autumn"
+    assert CountingClient.get_count == 1
+
+    store.create_series({"title": "Winter Series", "startDate": "2025-12-07"})
+    store.fetch_series()
+    assert CountingClient.get_count == 2
+
+
+def test_read_during_series_write_is_not_cached(tmp_path, monkeypatch, supabase_env):
     store = DataStore(data_dir=tmp_path)
 
-    sample_row = {
-        "id": "abc-123",
-        "code": "AUTUMN",
-        "title": "Autumn Series",
-        "start_date": "2025-09-07",
-        "metadata": {
-            "code": "AUTUMN",
-            "title": "Autumn Series",
-            "startDate": "2025-09-07",
-        },
-    }
+    class ConcurrentReadClient:
+        get_count = 0
 
-    class ConflictClient:
         def __init__(self, *args, **kwargs):
-            self._call_count = 0
+            pass
+
+        def get(self, endpoint, params, headers):
+            ConcurrentReadClient.get_count += 1
+            return _SeriesDummyResponse([
+                {"id": "series-1", "code": "AUT", "title": "Autumn", "start_date": "2025-09-07"}
+            ])
+
+        def post(self, endpoint, params, content, headers):
+            # Another request reads the series list before this write commits.
+            store.fetch_series()
+            request = loader_module.httpx.Request("POST", endpoint)
+            return loader_module.httpx.Response(201, request=request, json=[dict(json.loads(content), id="series-2")])
+
+    ConcurrentReadClient.get_count = 0
+    monkeypatch.setattr(loader_module.httpx, "Client", ConcurrentReadClient)
+
+    store.create_series({"title": "Winter Series", "startDate": "2025-12-07"})
+    assert ConcurrentReadClient.get_count == 1
+
+    store.fetch_series()
+    assert ConcurrentReadClient.get_count == 2
+
 
-        def __enter__(self):
-            return self
+def test_fetch_series_does_not_cache_local_fallback(tmp_path, monkeypatch, supabase_env):
+    store = DataStore(data_dir=tmp_path)
+    store._write_json_file(store.local_series_path, [{"id": "local-1", "code": "LOC", "title": "Local"}])
+
+    class FlakyClient:
+        get_count = 0
 
-        def __exit__(self, exc_type, exc, tb):  # pragma: no cover - no cleanup needed
-            return None
+        def __init__(self, *args, **kwargs):
+            pass
 
         def get(self, endpoint, params, headers):
-            self._call_count += 1
-            return _SeriesDummyResponse([sample_row])
-
-        def patch(self, endpoint, params, json, headers):
-            request = loader_module.httpx.Request("PATCH", endpoint)
-            response = loader_module.httpx.Response(
-                409,
-                request=request,
-                json={
-                    "message": "duplicate key value violates unique constraint \"series_code_key\""
-                },
-            )
-            raise loader_module.httpx.HTTPStatusError("Conflict", request=request, response=response)
+            FlakyClient.get_count += 1
+            if FlakyClient.get_count == 1:
+                raise loader_module.httpx.ConnectError("Supabase unreachable")
+            return _SeriesDummyResponse([
+                {"id": "series-1", "code": "AUT", "title": "Autumn", "start_date": "2025-09-07"}
+            ])
 
-    monkeypatch.setattr(loader_module.httpx, "Client", ConflictClient)
+    FlakyClient.get_count = 0
+    monkeypatch.setattr(loader_module.httpx, "Client", FlakyClient)
 
-    with pytest.raises(ValueError, match="Series code already exists"):
-        store.update_series("abc-123", {"title": "Autumn 2025"})
+    assert [row["code"] for row in store.fetch_series()] == ["LOC"]
+    assert [row["code"] for row in store.fetch_series()] == ["AUT"]
+    assert FlakyClient.get_count == 2
 
-    assert not store.local_series_path.exists()
+
+def test_cached_read_overlapping_invalidate_is_not_kept(tmp_path):
+    store = DataStore(data_dir=tmp_path)
+    calls = []
+
+    def fetcher():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            # A write lands while this read is still in flight.
+            store._invalidate("probe")
+        return list(calls)
+
+    assert store._cached(("probe",), 60.0, fetcher) == [0]
+    assert store._cached(("probe",), 60.0, fetcher) == [0, 1]
+    assert store._cached(("probe",), 60.0, fetcher) == [0, 1]
+    assert len(calls) == 2
+
+
+def test_series_summary_caches_only_supabase_hits(tmp_path, monkeypatch, supabase_env):
+    store = DataStore(data_dir=tmp_path)
+    rows: list[dict] = []
+
+    class SummaryClient:
+        get_count = 0
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def get(self, endpoint, params, headers):
+            SummaryClient.get_count += 1
+            return _SeriesDummyResponse(rows)
+
+    SummaryClient.get_count = 0
+    monkeypatch.setattr(loader_module.httpx, "Client", SummaryClient)
+
+    assert store._series_summary("series-1")["code"] == ""
+
+    rows.append({"id": "series-1", "code": "AUT", "title": "Autumn", "start_date": "2025-09-07"})
+    assert store._series_summary("series-1")["code"] == "AUT"
+    assert store._series_summary("series-1")["code"] == "AUT"
+    assert SummaryClient.get_count == 2
+
+
+def test_write_json_file_skips_identical_rewrites(tmp_path):
+    store = DataStore(data_dir=tmp_path)
+    path = tmp_path / "series_local.json"
+
+    store._write_json_file(path, [{"id": "series-1", "code": "AUT"}])
+    written_at = path.stat().st_mtime_ns
+    store._write_json_file(path, [{"code": "AUT", "id": "series-1"}])
+
+    assert path.stat().st_mtime_ns == written_at
+    assert [entry.name for entry in tmp_path.iterdir()] == ["series_local.json"]
+    assert json.loads(path.read_text()) == [{"id": "series-1", "code": "AUT"}]
+
+
+def test_concurrent_writes_to_one_store_do_not_collide(tmp_path):
+    store = DataStore(data_dir=tmp_path)
+    path = tmp_path / "series_signons_local.json"
+    start = threading.Barrier(2)
+    errors: list[Exception] = []
+
+    def write(writer: int) -> None:
+        start.wait()
+        for index in range(200):
+            try:
+                store._write_json_file(path, [{"writer": writer, "index": index}])
+            except RuntimeError as exc:
+                errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(writer,)) for writer in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert json.loads(path.read_text()) in ([{"writer": 0, "index": 199}], [{"writer": 1, "index": 199}])
+    assert [entry.name for entry in tmp_path.iterdir()] == [path.name]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Generator
+import functools
+import json
+from typing import Any, Dict
 
 import pytest  # type: ignore
 
@@ -15,8 +17,27 @@ class _Response:
     def raise_for_status(self) -> None:  # pragma: no cover - simple stub
         return None
 
-    def json(self) -> Any:
-        return self._payload
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode()
+
+
+class _RoutedClient:
+    """Fake ``httpx.Client`` answering GETs from responses keyed by endpoint suffix."""
+
+    def __init__(self, routes: Dict[str, _Response], *args: Any, **kwargs: Any) -> None:
+        self._routes = routes
+
+    def get(self, endpoint: str, params: Dict[str, Any], headers: Dict[str, str]) -> _Response:
+        for suffix, response in self._routes.items():
+            if endpoint.endswith(suffix):
+                return response
+        raise AssertionError(f"Unexpected endpoint: {endpoint}")
+
+
+def _install_routes(monkeypatch: pytest.MonkeyPatch, routes: Dict[str, Any]) -> None:
+    responses = {suffix: _Response(payload) for suffix, payload in routes.items()}
+    monkeypatch.setattr(loader_module.httpx, "Client", functools.partial(_RoutedClient, responses))
 
 
 def _build_series_row(metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
@@ -45,28 +66,22 @@ def _build_race_row(
         "id": race_id,
         "start_time": "2025-03-01T10:00:00Z",
         "created_at": "2025-03-01T11:00:00Z",
-        "payload": {
-            "response": {
-                "metadata": {
-                    "race": race_label,
-                    "raceNumber": int(race_id.split("-")[-1]),
-                    "date": "2025-03-01",
-                    "startTime": "10:00",
-                },
-                "pyResults": py_rows,
-                "personalResults": personal_rows,
-            }
+        "response": {
+            "metadata": {
+                "race": race_label,
+                "raceNumber": int(race_id.split("-")[-1]),
+                "date": "2025-03-01",
+                "startTime": "10:00",
+            },
+            "pyResults": py_rows,
+            "personalResults": personal_rows,
         },
     }
 
 
 @pytest.fixture(autouse=True)
-def reset_env(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
-    monkeypatch.delenv("SUPABASE_URL", raising=False)
-    monkeypatch.delenv("SUPABASE_SERVICE_ROLE_KEY", raising=False)
-    monkeypatch.delenv("SUPABASE_SERIES_TABLE", raising=False)
-    monkeypatch.delenv("SUPABASE_RACES_TABLE", raising=False)
-    yield
+def reset_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    # monkeypatch restores the environment itself once each test finishes.
     monkeypatch.delenv("SUPABASE_URL", raising=False)
     monkeypatch.delenv("SUPABASE_SERVICE_ROLE_KEY", raising=False)
     monkeypatch.delenv("SUPABASE_SERIES_TABLE", raising=False)
@@ -131,24 +146,10 @@ def test_fetch_series_standings_basic(monkeypatch: pytest.MonkeyPatch) -> None:
         ],
     )
 
-    class _Client:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def __enter__(self) -> "_Client":
-            return self
-
-        def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - nothing to clean up
-            return None
-
-        def get(self, endpoint: str, params: Dict[str, Any], headers: Dict[str, str]) -> _Response:
-            if endpoint.endswith("/rest/v1/series"):
-                return _Response([series_row])
-            if endpoint.endswith("/rest/v1/races"):
-                return _Response([race_one, race_two])
-            raise AssertionError(f"Unexpected endpoint: {endpoint}")
-
-    monkeypatch.setattr(loader_module.httpx, "Client", _Client)
+    _install_routes(
+        monkeypatch,
+        {"/rest/v1/series": [series_row], "/rest/v1/races": [race_one, race_two]},
+    )
 
     store = DataStore()
     standings = store.fetch_series_standings("series-1")
@@ -164,10 +165,10 @@ def test_fetch_series_standings_basic(monkeypatch: pytest.MonkeyPatch) -> None:
     alice = next(item for item in py_results if item["helm"] == "Alice")
     assert alice["scores"]["perRace"][0] == {"value": 1.0, "isDnc": False, "counted": True}
     assert alice["scores"]["perRace"][1]["isDnc"] is True
-    assert alice["scores"]["total"] == pytest.approx(5.0)
+    assert alice["scores"]["total"] == 5.0
 
     bob = next(item for item in py_results if item["helm"] == "Bob")
-    assert bob["scores"]["total"] == pytest.approx(3.0)
+    assert bob["scores"]["total"] == 3.0
     assert bob["rank"] == 1
 
     personal_results = standings["personalResults"]
@@ -220,24 +221,10 @@ def test_fetch_series_standings_honours_metadata_overrides(monkeypatch: pytest.M
         [{"entryId": "alice-r2", "rank": 2}],
     )
 
-    class _Client:
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-
-        def __enter__(self) -> "_Client":
-            return self
-
-        def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - nothing to clean up
-            return None
-
-        def get(self, endpoint: str, params: Dict[str, Any], headers: Dict[str, str]) -> _Response:
-            if endpoint.endswith("/rest/v1/series"):
-                return _Response([series_row])
-            if endpoint.endswith("/rest/v1/races"):
-                return _Response([race_one, race_two])
-            raise AssertionError(f"Unexpected endpoint: {endpoint}")
-
-    monkeypatch.setattr(loader_module.httpx, "Client", _Client)
+    _install_routes(
+        monkeypatch,
+        {"/rest/v1/series": [series_row], "/rest/v1/races": [race_one, race_two]},
+    )
 
     store = DataStore()
     standings = store.fetch_series_standings("series-1")
@@ -247,4 +234,4 @@ def test_fetch_series_standings_honours_metadata_overrides(monkeypatch: pytest.M
     alice_scores = standings["pyResults"][0]["scores"]
     counted_flags = [cell["counted"] for cell in alice_scores["perRace"]]
     assert counted_flags.count(True) == 1
-    assert alice_scores["total"] == pytest.approx(1.0)
+    assert alice_scores["total"] == 1.0
@@ -1,72 +1,85 @@
 from __future__ import annotations
 
+import functools
 import json
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import typing as t
-
-try:  # pragma: no cover - import guard for type checkers
-    import pytest  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - pytest always available at runtime
-    pytest = t.cast(t.Any, None)
+import orjson
+import pytest
 
 from swsc_core import loader as loader_module
 from swsc_core.loader import DataStore
 
 
-class _SuccessClient:
-    requests: List[Dict[str, Any]] = []
+_Respond = Callable[[List[Dict[str, Any]]], Optional[Tuple[int, str]]]
 
-    def __init__(self, *args, **kwargs) -> None:
-        pass
 
-    def __enter__(self) -> "_SuccessClient":
-        return self
+class _FakeClient:
+    """Records upsert payloads and answers each with the error ``respond`` picks, if any."""
 
-    def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - nothing to clean
-        return None
+    def __init__(self, respond: _Respond, requests: List[Dict[str, Any]], *args, **kwargs) -> None:
+        self._respond = respond
+        self._requests = requests
 
-    def post(self, endpoint: str, params: Dict[str, Any], json: Any, headers: Dict[str, str]):
-        _SuccessClient.requests.append(
-            {
-                "endpoint": endpoint,
-                "params": params,
-                "json": json,
-                "headers": headers,
-            }
-        )
+    def post(self, endpoint: str, params: Dict[str, Any], content: bytes, headers: Dict[str, str]):
+        payload = json.loads(content)
+        self._requests.append({"endpoint": endpoint, "params": params, "json": payload, "headers": headers})
         request = loader_module.httpx.Request("POST", endpoint)
-        return loader_module.httpx.Response(201, request=request, json=json)
+        error = self._respond(payload)
+        if error is None:
+            return loader_module.httpx.Response(201, request=request, json=payload)
+        status_code, message = error
+        response = loader_module.httpx.Response(status_code, request=request, json={"message": message})
+        raise loader_module.httpx.HTTPStatusError(message, request=request, response=response)
 
 
-class _FailingClient:
-    def __init__(self, *args, **kwargs) -> None:
-        pass
+def _install_client(monkeypatch, respond: _Respond = lambda payload: None) -> List[Dict[str, Any]]:
+    """Patch ``httpx.Client`` with a :class:`_FakeClient` and return its request log."""
 
-    def __enter__(self) -> "_FailingClient":
-        return self
+    requests: List[Dict[str, Any]] = []
+    monkeypatch.setattr(loader_module.httpx, "Client", functools.partial(_FakeClient, respond, requests))
+    return requests
 
-    def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - nothing to clean
-        return None
 
-    def post(self, endpoint: str, params: Dict[str, Any], json: Any, headers: Dict[str, str]):
-        request = loader_module.httpx.Request("POST", endpoint)
-        response = loader_module.httpx.Response(
-            400,
-            request=request,
-            json={"message": "invalid payload"},
-        )
-        raise loader_module.httpx.HTTPStatusError("Bad Request", request=request, response=response)
+def _reject_all(payload: List[Dict[str, Any]]) -> Tuple[int, str]:
+    return 400, "invalid payload"
 
 
-def _write_json(path, payload):
-    path.write_text(json.dumps(payload))
+def _reject_bad_row(payload: List[Dict[str, Any]]) -> Optional[Tuple[int, str]]:
+    """Rejects any batch that contains the schedule row with id ``sched-bad``."""
+
+    if any(record.get("id") == "sched-bad" for record in payload):
+        return 400, "bad row"
+    return None
+
+
+def _reject_duplicate_ids(payload: List[Dict[str, Any]]) -> Optional[Tuple[int, str]]:
+    """Mimics PostgREST, which fails a bulk upsert that hits one conflict key twice."""
+
+    ids = [record.get("id") for record in payload]
+    if len(ids) != len(set(ids)):
+        return 500, "ON CONFLICT DO UPDATE command cannot affect row a second time"
+    return None
+
+
+def _unavailable(payload: List[Dict[str, Any]]) -> Tuple[int, str]:
+    return 503, "service unavailable"
+
+
+def _schedule_row(row_id: str) -> Dict[str, Any]:
+    return {
+        "id": row_id,
+        "series_code": "AUT25",
+        "date": "2025-10-05",
+        "metadata": {"series": "Autumn 2025", "race": row_id, "date": "2025-10-05"},
+    }
+
 
+def _write_json(path, payload):
+    path.write_bytes(orjson.dumps(payload))
 
-def test_sync_local_backlog_success(tmp_path, monkeypatch):
-    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
-    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key")
 
+def test_sync_local_backlog_success(tmp_path, monkeypatch, supabase_env):
     store = DataStore(data_dir=tmp_path)
 
     series_entry = {
@@ -101,8 +114,7 @@ def test_sync_local_backlog_success(tmp_path, monkeypatch):
     _write_json(store.local_series_path, [series_entry])
     _write_json(store.local_schedule_path, [schedule_entry])
 
-    _SuccessClient.requests = []
-    monkeypatch.setattr(loader_module.httpx, "Client", _SuccessClient)
+    requests = _install_client(monkeypatch)
 
     summary = store.sync_local_backlog()
 
@@ -111,20 +123,17 @@ def test_sync_local_backlog_success(tmp_path, monkeypatch):
     assert not store.local_series_path.exists()
     assert not store.local_schedule_path.exists()
 
-    assert len(_SuccessClient.requests) == 2
-    series_request = _SuccessClient.requests[0]
+    assert len(requests) == 2
+    series_request = requests[0]
     assert series_request["params"].get("on_conflict") == "code"
     assert series_request["json"][0]["code"] == "AUT25"
 
-    schedule_request = _SuccessClient.requests[1]
+    schedule_request = requests[1]
     assert schedule_request["params"].get("on_conflict") == "id"
     assert schedule_request["json"][0]["id"] == "sched-1"
 
 
-def test_sync_local_backlog_schedule_failure(tmp_path, monkeypatch):
-    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
-    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key")
-
+def test_sync_local_backlog_schedule_failure(tmp_path, monkeypatch, supabase_env):
     store = DataStore(data_dir=tmp_path)
 
     schedule_entry = {
@@ -147,7 +156,7 @@ def test_sync_local_backlog_schedule_failure(tmp_path, monkeypatch):
 
     _write_json(store.local_schedule_path, [schedule_entry])
 
-    monkeypatch.setattr(loader_module.httpx, "Client", _FailingClient)
+    _install_client(monkeypatch, _reject_all)
 
     summary = store.sync_local_backlog()
 
@@ -157,6 +166,86 @@ def test_sync_local_backlog_schedule_failure(tmp_path, monkeypatch):
     assert store.local_schedule_path.exists()
 
 
+def test_sync_local_backlog_batches_rows(tmp_path, monkeypatch, supabase_env):
+    store = DataStore(data_dir=tmp_path)
+    _write_json(store.local_schedule_path, [_schedule_row(f"sched-{index}") for index in range(3)])
+
+    requests = _install_client(monkeypatch)
+
+    summary = store.sync_local_backlog()
+
+    assert summary["schedule"] == {"synced": 3, "remaining": 0, "errors": []}
+    assert len(requests) == 1
+    assert [record["id"] for record in requests[0]["json"]] == ["sched-0", "sched-1", "sched-2"]
+
+
+def test_sync_local_backlog_retries_rejected_batch_per_row(tmp_path, monkeypatch, supabase_env):
+    store = DataStore(data_dir=tmp_path)
+    rows = [_schedule_row("sched-a"), _schedule_row("sched-bad"), _schedule_row("sched-b")]
+    _write_json(store.local_schedule_path, rows)
+
+    requests = _install_client(monkeypatch, _reject_bad_row)
+
+    summary = store.sync_local_backlog()
+
+    assert summary["schedule"] == {"synced": 2, "remaining": 1, "errors": ["bad row"]}
+    assert [len(request["json"]) for request in requests] == [3, 1, 1, 1]
+    remaining = json.loads(store.local_schedule_path.read_text())
+    assert [row["id"] for row in remaining] == ["sched-bad"]
+
+
+def test_sync_local_backlog_stops_after_server_failure(tmp_path, monkeypatch, supabase_env):
+    monkeypatch.setattr(loader_module, "SYNC_BATCH_SIZE", 1)
+
+    store = DataStore(data_dir=tmp_path)
+    _write_json(store.local_schedule_path, [_schedule_row(f"sched-{index}") for index in range(3)])
+
+    requests = _install_client(monkeypatch, _unavailable)
+
+    summary = store.sync_local_backlog()
+
+    assert len(requests) == 1
+    assert summary["schedule"] == {
+        "synced": 0,
+        "remaining": 3,
+        "errors": ["service unavailable", "Skipped 2 schedule rows after Supabase failed"],
+    }
+    remaining = json.loads(store.local_schedule_path.read_text())
+    assert [row["id"] for row in remaining] == ["sched-0", "sched-1", "sched-2"]
+
+
+def test_sync_local_backlog_sends_latest_row_per_conflict_key(tmp_path, monkeypatch, supabase_env):
+    store = DataStore(data_dir=tmp_path)
+    edited = _schedule_row("sched-a")
+    edited["metadata"]["race"] = "Race A (moved)"
+    _write_json(store.local_schedule_path, [_schedule_row("sched-a"), _schedule_row("sched-b"), edited])
+
+    requests = _install_client(monkeypatch, _reject_duplicate_ids)
+
+    summary = store.sync_local_backlog()
+
+    assert summary["schedule"] == {"synced": 2, "remaining": 0, "errors": []}
+    assert len(requests) == 1
+    sent = {record["id"]: record for record in requests[0]["json"]}
+    assert sorted(sent) == ["sched-a", "sched-b"]
+    assert sent["sched-a"]["metadata"]["race"] == "Race A (moved)"
+    assert not store.local_schedule_path.exists()
+
+
+def test_sync_local_backlog_keeps_superseded_rows_when_latest_fails(tmp_path, monkeypatch, supabase_env):
+    store = DataStore(data_dir=tmp_path)
+    rows = [_schedule_row("sched-bad"), _schedule_row("sched-a"), _schedule_row("sched-bad")]
+    _write_json(store.local_schedule_path, rows)
+
+    _install_client(monkeypatch, _reject_bad_row)
+
+    summary = store.sync_local_backlog()
+
+    assert summary["schedule"] == {"synced": 1, "remaining": 2, "errors": ["bad row"]}
+    remaining = json.loads(store.local_schedule_path.read_text())
+    assert [row["id"] for row in remaining] == ["sched-bad", "sched-bad"]
+
+
 def test_sync_local_backlog_requires_supabase(tmp_path, monkeypatch):
     monkeypatch.delenv("SUPABASE_URL", raising=False)
     monkeypatch.delenv("SUPABASE_SERVICE_ROLE_KEY", raising=False)
@@ -1,5 +1,9 @@
+import asyncio
 import os
 
+import orjson
+from fastapi import BackgroundTasks
+
 os.environ.setdefault("SUPABASE_URL", "https://fazawdwokaahuslisksn.supabase.co")
 os.environ.setdefault(
     "SUPABASE_SERVICE_ROLE_KEY",
@@ -29,5 +33,8 @@ payload = ScoreRequest(
     ],
 )
 
-result = score(payload)
-print(result)
+background_tasks = BackgroundTasks()
+result = score(payload, background_tasks)
+print(orjson.loads(result.body))
+# score() defers persistence to a background task; run it as the server would.
+asyncio.run(background_tasks())